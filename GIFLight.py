@@ -1,7 +1,11 @@
 import asyncio
+import collections
 import concurrent.futures
-import glob
+import functools
+import json
 import os
+import queue
+import re
 import shutil
 import sys
 import subprocess
@@ -14,7 +18,7 @@ from tkinter import ttk, messagebox
 from typing import Optional, Tuple, List
 import platform
 import ttkbootstrap as ttk
-from PIL import Image, ImageTk
+from PIL import Image, ImageSequence, ImageTk
 from tkinterdnd2 import DND_FILES, TkinterDnD
 
 from options_window import OptionsWindow
@@ -24,9 +28,18 @@ if sys.platform == 'win32':
 
     CREATE_NO_WINDOW = 0x08000000
     SW_HIDE = 0x0
+
+    # Hidden-console subprocess settings are identical for every spawn,
+    # so build them once instead of per call
+    _WIN_STARTUPINFO = subprocess.STARTUPINFO()
+    _WIN_STARTUPINFO.dwFlags |= subprocess.STARTF_USESHOWWINDOW
+    _WIN_STARTUPINFO.wShowWindow = subprocess.SW_HIDE
+    _WIN_CREATIONFLAGS = CREATE_NO_WINDOW | SW_HIDE if getattr(sys, 'frozen', False) else CREATE_NO_WINDOW
 else:
     CREATE_NO_WINDOW = 0
     SW_HIDE = 0
+    _WIN_STARTUPINFO = None
+    _WIN_CREATIONFLAGS = 0
 
 # Determine the base path when running in a frozen bundle (PyInstaller)
 os.environ["MAGICK_DEBUG"] = "Module"
@@ -45,18 +58,40 @@ os.environ["MAGICK_CODER_MODULE_PATH"] = coder_path
 # (Optional) You can print or log the path for debugging:
 # print("MAGICK_CODER_MODULE_PATH set to:", coder_path)
 
-def get_binary_path(binary_name: str) -> str:
-    """
-    Get the correct path to a bundled binary, handling PyInstaller directories
-    and macOS ARM64 vs Intel differences.
-    """
-    # Determine base directory for binaries
+# Platform facts cannot change at runtime, so evaluate them once here;
+# platform.machine() in particular goes through uname on every call
+_IS_WIN32 = sys.platform == 'win32'
+_IS_DARWIN = sys.platform == 'darwin'
+_IS_DARWIN_ARM64 = _IS_DARWIN and platform.machine() == 'arm64'
+
+
+def _resolve_bin_base_path() -> str:
+    """Resolve the bundled-binary directory once at import time."""
     if getattr(sys, 'frozen', False):
         base_path = os.path.join(sys._MEIPASS, 'bin')
     else:
         # In development, binaries are in a local "bin" subfolder
         base_path = os.path.join(os.path.abspath(os.path.dirname(__file__)), 'bin')
 
+    # macOS ARM64 builds may ship binaries in a dedicated subdirectory
+    if _IS_DARWIN_ARM64:
+        arm64_dir = os.path.join(base_path, 'arm64')
+        if os.path.isdir(arm64_dir):
+            base_path = arm64_dir
+    return base_path
+
+
+# Computed once - the base path cannot change while the app is running
+_BIN_BASE_PATH = _resolve_bin_base_path()
+
+
+def get_binary_path(binary_name: str) -> str:
+    """
+    Get the correct path to a bundled binary, handling PyInstaller directories
+    and macOS ARM64 vs Intel differences.
+    """
+    base_path = _BIN_BASE_PATH
+
     # Only allow known binaries
     allowed_binaries = {'ffmpeg', 'gifski', 'gifsicle', 'ffprobe', 'magick'}
     binary_base = os.path.splitext(binary_name.lower())[0]
@@ -64,18 +99,14 @@ def get_binary_path(binary_name: str) -> str:
         raise ValueError(f"Invalid binary name: {binary_name}")
 
     # Append extension for Windows executables
-    if sys.platform == 'win32':
+    if _IS_WIN32:
         binary_filename = f"{binary_base}.exe"
     else:
         # On macOS (and other Unix), use the base name (executables typically have no extension)
         binary_filename = binary_base
 
-    # Handle macOS ARM64: prefer arm64-specific binaries if available
-    if sys.platform == 'darwin' and platform.machine() == 'arm64':
-        arm64_dir = os.path.join(base_path, 'arm64')
-        if os.path.isdir(arm64_dir):
-            base_path = arm64_dir  # Use dedicated arm64 subdirectory if present
-        # If no arm64 subdirectory, consider arm64 or universal binaries in main bin
+    # Handle macOS ARM64: prefer arm64 or universal binary variants if available
+    if _IS_DARWIN_ARM64:
         arm64_variant = os.path.join(base_path, f"{binary_base}_arm64")
         universal_variant = os.path.join(base_path, f"{binary_base}_universal")
         if os.path.exists(arm64_variant):
@@ -96,25 +127,232 @@ def get_binary_path(binary_name: str) -> str:
     if not os.path.normpath(binary_path).startswith(os.path.normpath(base_path)):
         raise ValueError(f"Binary path points outside of expected directory: {binary_path}")
 
-    # On macOS, ensure the binary has execute permission
-    if sys.platform == 'darwin':
+    # On macOS, ensure the binary has execute permission; only issue the
+    # chmod syscall when the execute bits are actually missing
+    if _IS_DARWIN:
         try:
-            os.chmod(binary_path, 0o755)  # rwx for owner, rx for group/others
+            if os.stat(binary_path).st_mode & 0o111 != 0o111:
+                os.chmod(binary_path, 0o755)  # rwx for owner, rx for group/others
         except Exception as e:
             print(f"Warning: Could not set executable permissions on {binary_path}: {e}")
     return binary_path
 
 
-# Update all the paths using the same function
-FFMPEG_PATH = get_binary_path('ffmpeg')
+# Resolve all bundled binary paths in one pass
+_BINARY_PATHS = {name: get_binary_path(name) for name in ('ffmpeg', 'ffprobe', 'gifski', 'gifsicle', 'magick')}
+
+FFMPEG_PATH = _BINARY_PATHS['ffmpeg']
+FFPROBE_PATH = _BINARY_PATHS['ffprobe']
+GIFSKI_PATH = _BINARY_PATHS['gifski']
+GIFSICLE_PATH = _BINARY_PATHS['gifsicle']
+IMAGEMAGICK_PATH = _BINARY_PATHS['magick']
+
+# ffprobe results keyed by (path, mtime, size) - metadata cannot change
+# without one of those changing, so cached entries never go stale
+_PROBE_CACHE: dict = {}
+
+# Thread budgeting: the heavy work happens inside ffmpeg/gifski, so the
+# Python pool only needs enough workers to keep that many subprocesses in
+# flight, and each ffmpeg gets a share of the cores so the total roughly
+# matches the machine instead of oversubscribing it
+_CPU_COUNT = os.cpu_count() or 2
+_MAX_PARALLEL_JOBS = max(1, _CPU_COUNT // 2)
+_FFMPEG_THREADS = max(1, _CPU_COUNT // _MAX_PARALLEL_JOBS)
+
+# GIFs below this size are not worth an ImageMagick re-encode pass; the
+# decode/re-encode cost dwarfs the handful of bytes it could still save
+_SMALL_GIF_THRESHOLD = 50 * 1024
+
+# Progress bar strings, one per fill level, built once at import instead of
+# re-concatenated on every tick of the optimization progress loop
+_BAR_WIDTH = 15
+_BARS = ['█' * i + '░' * (_BAR_WIDTH - i) for i in range(_BAR_WIDTH + 1)]
+
+# Pulse border colors for every alpha level, built once at import; the
+# 60 fps pulse animation indexes this instead of formatting a fresh color
+# string per tick
+_PULSE_COLORS = tuple(f'#{alpha:02x}007bff' for alpha in range(256))
+
+# Binaries whose permissions/arch have already been verified this process
+_CHECKED_BINARIES: set = set()
+
+
+def _ensure_binary_ready(binary_path: str):
+    """
+    One-time per-process check that a bundled binary is executable (and, on
+    Apple Silicon, natively built). Repeating chmod plus the `file` probe on
+    every spawn cost two syscalls and an extra fork per subprocess.
+    """
+    if not binary_path or binary_path in _CHECKED_BINARIES:
+        return
+    _CHECKED_BINARIES.add(binary_path)
+
+    if _IS_WIN32 or not os.path.exists(binary_path):
+        return
+
+    try:
+        os.chmod(binary_path, 0o755)  # make sure the binary is executable
+        # Also ensure the containing directory has execute permission (allow traversal)
+        binary_dir = os.path.dirname(binary_path)
+        if binary_dir:
+            os.chmod(binary_dir, 0o755)
+    except Exception as e:
+        print(f"Warning: Could not set executable permissions on {binary_path}: {e}")
+
+    # On macOS ARM64, warn if an x86_64 binary is being used (optional diagnostic)
+    if _IS_DARWIN_ARM64:
+        try:
+            result = subprocess.run(['file', binary_path], stdout=subprocess.PIPE,
+                                    stderr=subprocess.PIPE, text=True)
+            # If `file` mentions neither arm64 nor Rosetta, it might be an Intel binary
+            if result.returncode == 0 and 'arm64' not in result.stdout and 'Rosetta' not in result.stdout:
+                print(f"Warning: {os.path.basename(binary_path)} may not be ARM64-optimized (running via Rosetta)")
+        except Exception:
+            pass  # If the `file` command isn't available or fails, ignore this check
+
+# Whether the bundled gifsicle is >= 1.96, probed once per process. 1.96
+# switched --lossy to work in linear light, which changes output on the dark
+# gradients our tuned lossy levels were chosen against; --gamma=1 restores
+# the pre-1.96 behaviour
+_GIFSICLE_LOSSY_GAMMA = None
+
+
+def _gifsicle_lossy_args(lossy: int) -> list:
+    """Arguments selecting gifsicle's lossy mode, adjusted for its version."""
+    global _GIFSICLE_LOSSY_GAMMA
+    if _GIFSICLE_LOSSY_GAMMA is None:
+        version = (0, 0)
+        try:
+            kwargs = {'stdout': subprocess.PIPE, 'stderr': subprocess.STDOUT, 'text': True}
+            if _IS_WIN32:
+                kwargs['startupinfo'] = _WIN_STARTUPINFO
+                kwargs['creationflags'] = _WIN_CREATIONFLAGS
+            result = subprocess.run([GIFSICLE_PATH, '--version'], **kwargs)
+            match = re.search(r'(\d+)\.(\d+)', result.stdout or '')
+            if match:
+                version = (int(match.group(1)), int(match.group(2)))
+        except Exception:
+            pass
+        _GIFSICLE_LOSSY_GAMMA = version >= (1, 96)
+    if _GIFSICLE_LOSSY_GAMMA:
+        return ['--gamma=1', f'--lossy={lossy}']
+    return [f'--lossy={lossy}']
 
-GIFSKI_PATH = get_binary_path('gifski')
-GIFSICLE_PATH = get_binary_path('gifsicle')
-IMAGEMAGICK_PATH = get_binary_path('magick')
 
 # Add to the allowed_binaries set in get_binary_path:
 allowed_binaries = {'ffmpeg', 'gifski', 'gifsicle', 'ffprobe', 'magick'}
 
+# Matches dropped file paths, which may be curly-braced, quoted, or bare
+# (tkinterdnd2 format); compiled once rather than per drop event
+_DROP_PATH_RE = re.compile(r'(?:\{([^}]+)\})|(?:"([^"]+)")|(?:(\S+))')
+
+# Treeview status strings, defined once so every row update reuses the
+# same objects instead of scattering literals through the batch code
+_ST_QUEUED = 'Queued'
+_ST_PROCESSING = 'Processing'
+_ST_COMPLETED = 'Completed'
+_ST_FAILED = 'Failed'
+
+
+@functools.lru_cache(maxsize=128)
+def _queue_status_text(queue_size: int, processing_index: int) -> str:
+    """Build (and cache) the queue status label text."""
+    if queue_size == 0:
+        status_text = "Queue empty"
+    elif queue_size == 1:
+        status_text = "1 file in queue"
+    else:
+        status_text = f"{queue_size} files in queue"
+
+    if processing_index >= 0:
+        status_text += f" | Processing {processing_index + 1}/{queue_size}"
+    return status_text
+
+
+# Main-window ttk styles, applied in one pass by
+# ModernGifConverter.setup_styles. Keeping the palette in a single table
+# replaces a dozen configure call sites and makes theme tweaks one edit
+_STYLES = {
+    'TFrame': {'background': '#1a1a1a'},
+    'TLabel': {'background': '#1a1a1a', 'foreground': '#ffffff'},
+    # Drop zone container
+    'DropZone.TFrame': {'background': '#1a1a1a', 'borderwidth': 2,
+                        'relief': 'solid'},
+    # Drop label - default and hover states (both need the centering)
+    'Custom.TLabel': {'background': '#2d2d2d', 'foreground': '#ffffff',
+                      'font': ('Segoe UI', 12), 'borderwidth': 2,
+                      'relief': 'solid', 'padding': 20, 'anchor': 'center',
+                      'justify': 'center'},
+    'Custom.Hover.TLabel': {'background': '#3d3d3d', 'foreground': '#ffffff',
+                            'font': ('Segoe UI', 12, 'bold'), 'borderwidth': 2,
+                            'relief': 'solid', 'padding': 20,
+                            'anchor': 'center', 'justify': 'center'},
+    'Success.TLabel': {'background': '#1a1a1a', 'foreground': '#28a745'},
+    'Error.TLabel': {'background': '#1a1a1a', 'foreground': '#dc3545'},
+    'Primary.TButton': {'background': '#007bff', 'foreground': 'white',
+                        'font': ('Segoe UI', 10, 'bold'), 'padding': (5, 2)},
+    'TEntry': {'fieldbackground': '#2d2d2d', 'foreground': 'white',
+               'insertcolor': 'white'},
+    'TProgressbar': {'background': '#007bff', 'troughcolor': '#2d2d2d',
+                     'borderwidth': 0, 'thickness': 10},
+    # Stop button
+    'Danger.TButton': {'background': '#dc3545', 'foreground': 'white',
+                       'font': ('Segoe UI', 10, 'bold'), 'padding': (5, 2)},
+}
+
+_batch_styles_installed = False
+
+
+def _install_batch_styles():
+    """
+    Configure the batch-widget ttk styles. Styles are global to the Tk
+    interpreter, so this runs once per process; reconfiguring them on every
+    BatchProcessingFrame construction just forced Tcl style revalidation.
+    """
+    global _batch_styles_installed
+    if _batch_styles_installed:
+        return
+    _batch_styles_installed = True
+
+    style = ttk.Style()
+
+    # Queue list style
+    style.configure('Queue.Treeview',
+                    background='#2d2d2d',
+                    foreground='white',
+                    fieldbackground='#2d2d2d',
+                    rowheight=22)
+
+    style.map('Queue.Treeview',
+              background=[('selected', '#3d3d3d')],
+              foreground=[('selected', 'white')])
+
+    # Batch control buttons
+    style.configure('BatchControl.TButton',
+                    background='#007bff',
+                    foreground='white',
+                    font=('Segoe UI', 9))
+
+    style.configure('BatchRemove.TButton',
+                    background='#dc3545',
+                    foreground='white',
+                    font=('Segoe UI', 9))
+
+    # Status colors
+    style.configure('Success.TLabel',
+                    foreground='#28a745')
+
+    style.configure('Error.TLabel',
+                    foreground='#dc3545')
+
+    # Header frame style
+    style.configure('BatchHeader.TFrame',
+                    background='#252525')
+
+    # Batch queue frame style
+    style.configure('BatchQueue.TFrame',
+                    background='#1e1e1e')
+
 
 class BatchProcessingFrame(ttk.Frame):
     """Frame to handle batch processing of multiple files"""
@@ -122,58 +360,32 @@ class BatchProcessingFrame(ttk.Frame):
     def __init__(self, master, converter):
         super().__init__(master)
         self.converter = converter
+
+        # The converter builds its widgets before constructing this frame,
+        # so snapshot the ones the batch callbacks touch instead of
+        # re-checking them with hasattr on every event
+        self._convert_button = getattr(converter, 'convert_button', None)
+        self._smart_panel = getattr(converter, 'smart_panel', None)
+        self._tab_buttons_frame = getattr(converter, 'tab_buttons_frame', None)
+        self._log_frame = getattr(converter, 'log_frame', None)
+
+        # Queue state: file_queue holds processing order, _queue_state maps
+        # each path to its derived row data (basename computed once at
+        # insert, current status/size) so per-event updates are O(1) dict
+        # lookups with no repeated os.path.basename calls
         self.file_queue: List[str] = []
+        self._queue_state: dict = {}
         self.current_processing_index: int = -1
         self.is_processing_batch: bool = False
+        self._bulk_adding: bool = False
 
-        self.setup_styles()
+        _install_batch_styles()
         self.create_widgets()
 
         # Configure the frame to expand properly
         self.columnconfigure(0, weight=1)
         self.rowconfigure(1, weight=1)
 
-    def setup_styles(self):
-        """Configure styles for batch processing widgets"""
-        self.style = ttk.Style()
-
-        # Queue list style
-        self.style.configure('Queue.Treeview',
-                             background='#2d2d2d',
-                             foreground='white',
-                             fieldbackground='#2d2d2d',
-                             rowheight=22)
-
-        self.style.map('Queue.Treeview',
-                       background=[('selected', '#3d3d3d')],
-                       foreground=[('selected', 'white')])
-
-        # Batch control buttons
-        self.style.configure('BatchControl.TButton',
-                             background='#007bff',
-                             foreground='white',
-                             font=('Segoe UI', 9))
-
-        self.style.configure('BatchRemove.TButton',
-                             background='#dc3545',
-                             foreground='white',
-                             font=('Segoe UI', 9))
-
-        # Status colors
-        self.style.configure('Success.TLabel',
-                             foreground='#28a745')
-
-        self.style.configure('Error.TLabel',
-                             foreground='#dc3545')
-
-        # Header frame style
-        self.style.configure('BatchHeader.TFrame',
-                             background='#252525')
-
-        # Batch queue frame style
-        self.style.configure('BatchQueue.TFrame',
-                             background='#1e1e1e')
-
     def create_widgets(self):
         """Create and arrange widgets for batch processing"""
         # Batch processing header with border and padding
@@ -252,18 +464,9 @@ class BatchProcessingFrame(ttk.Frame):
 
     def update_queue_status(self):
         """Update the status display of the queue"""
-        queue_size = len(self.file_queue)
-        if queue_size == 0:
-            status_text = "Queue empty"
-        elif queue_size == 1:
-            status_text = "1 file in queue"
-        else:
-            status_text = f"{queue_size} files in queue"
-
-        if self.current_processing_index >= 0:
-            status_text += f" | Processing {self.current_processing_index + 1}/{queue_size}"
-
-        self.status_label.configure(text=status_text)
+        self.status_label.configure(
+            text=_queue_status_text(len(self.file_queue), self.current_processing_index)
+        )
 
     def add_file_to_queue(self, file_path: str) -> bool:
         """
@@ -275,47 +478,62 @@ class BatchProcessingFrame(ttk.Frame):
         Returns:
             bool: True if file was added, False if it was already in the queue
         """
-        # Check if file is already in queue
-        for existing_file in self.file_queue:
-            if existing_file == file_path:
-                return False
+        # Check if file is already in queue (O(1) dict membership)
+        if file_path in self._queue_state:
+            return False
 
-        # Add file to queue
+        # Add file to queue, computing the basename once at insert
+        filename = os.path.basename(file_path)
         self.file_queue.append(file_path)
+        self._queue_state[file_path] = {'basename': filename, 'status': _ST_QUEUED, 'size': ''}
 
-        # Add to treeview
-        filename = os.path.basename(file_path)
-        self.queue_list.insert('', 'end', values=(filename, "Queued", ""))
+        # Add to treeview, keyed by full path so later updates/removals
+        # can address the row directly instead of scanning
+        self.queue_list.insert('', 'end', iid=file_path, values=(filename, _ST_QUEUED, ""))
 
-        # Update the status text
-        self.update_queue_status()
+        # During a bulk add the per-file refreshes are deferred to
+        # end_bulk_add so Tk only relayouts once for the whole drop
+        if not self._bulk_adding:
+            # Update the status text
+            self.update_queue_status()
 
-        # Update the Convert button text based on the number of files
-        self.update_convert_button_text()
+            # Update the Convert button text based on the number of files
+            self.update_convert_button_text()
 
-        # Enable the convert button whenever we have files in the queue
-        if hasattr(self.converter, 'convert_button'):
-            self.converter.convert_button.configure(state='normal')
+            # Enable the convert button whenever we have files in the queue
+            if self._convert_button is not None:
+                self._convert_button.configure(state='normal')
 
-        # Show or hide the smart panel based on the number of files
-        self.update_smart_panel_visibility()
+            # Show or hide the smart panel based on the number of files
+            self.update_smart_panel_visibility()
 
         return True
 
+    def begin_bulk_add(self):
+        """Suspend per-file UI refreshes while many files are queued at once"""
+        self._bulk_adding = True
+
+    def end_bulk_add(self):
+        """Re-enable UI refreshes and apply the deferred updates once"""
+        self._bulk_adding = False
+        self.update_queue_status()
+        self.update_convert_button_text()
+        if self.file_queue and self._convert_button is not None:
+            self._convert_button.configure(state='normal')
+        self.update_smart_panel_visibility()
+
     def update_smart_panel_visibility(self):
         """Show or hide the smart panel based on the number of files in the queue"""
-        if hasattr(self.converter, 'smart_panel'):
+        if self._smart_panel is not None:
             if len(self.file_queue) >= 2:
                 # Show the smart panel and switch to batch tab
-                self.converter.smart_panel.grid()
-                if hasattr(self.converter, 'switch_tab'):
-                    self.converter.switch_tab("batch")
+                self._smart_panel.grid()
+                self.converter.switch_tab("batch")
             else:
                 # Hide the smart panel if fewer than 2 files
-                self.converter.smart_panel.grid_remove()
+                self._smart_panel.grid_remove()
                 # Reset active tab
-                if hasattr(self.converter, 'active_tab'):
-                    self.converter.active_tab = None
+                self.converter.active_tab = None
 
     def remove_selected_file(self):
         """Remove the selected file from the queue and reset state if queue becomes empty"""
@@ -324,13 +542,10 @@ class BatchProcessingFrame(ttk.Frame):
             return
 
         for item_id in selected:
-            item_values = self.queue_list.item(item_id, 'values')
-            filename = item_values[0]
-
-            # Find the corresponding file path
-            for file_path in self.file_queue[:]:
-                if os.path.basename(file_path) == filename:
-                    self.file_queue.remove(file_path)
+            # Items are keyed by their full path, so removal is direct
+            if item_id in self._queue_state:
+                self.file_queue.remove(item_id)
+                del self._queue_state[item_id]
 
             # Remove from treeview
             self.queue_list.delete(item_id)
@@ -345,15 +560,14 @@ class BatchProcessingFrame(ttk.Frame):
         if not self.file_queue:
             self.current_processing_index = -1
             self.is_processing_batch = False
-            if hasattr(self.converter, 'convert_button'):
+            if self._convert_button is not None:
                 # Always set to Convert when queue is empty
-                self.converter.convert_button.configure(text="Convert")
+                self._convert_button.configure(text="Convert")
 
             # Also clear the currently loaded file in the converter
-            if hasattr(self.converter, 'selected_file'):
-                self.converter.selected_file = None
-                self.converter.file_label.configure(text="No file selected")
-                self.converter.convert_button.configure(state='disabled')
+            self.converter.selected_file = None
+            self.converter.file_label.configure(text="No file selected")
+            self._convert_button.configure(state='disabled')
 
             # Revert the UI to its launch state
             self.reset_ui_to_launch_state()
@@ -365,6 +579,7 @@ class BatchProcessingFrame(ttk.Frame):
         """Clear all files from the queue and reset the selected file"""
         # Clear the file queue
         self.file_queue.clear()
+        self._queue_state.clear()
 
         # Clear the display
         for item in self.queue_list.get_children():
@@ -373,10 +588,10 @@ class BatchProcessingFrame(ttk.Frame):
         # Reset processing state
         self.current_processing_index = -1
         self.is_processing_batch = False
-        if hasattr(self.converter, 'convert_button'):
+        if self._convert_button is not None:
             # Set button text based on number of files in queue
             button_text = "Process Batch" if len(self.file_queue) >= 2 else "Convert"
-            self.converter.convert_button.configure(text=button_text)
+            self._convert_button.configure(text=button_text)
 
         # Update the status text
         self.update_queue_status()
@@ -385,20 +600,24 @@ class BatchProcessingFrame(ttk.Frame):
         self.update_convert_button_text()
 
         # Also clear the currently loaded file in the converter
-        if hasattr(self.converter, 'selected_file'):
-            self.converter.selected_file = None
-            self.converter.file_label.configure(text="No file selected")
-            self.converter.convert_button.configure(state='disabled')
+        self.converter.selected_file = None
+        self.converter.file_label.configure(text="No file selected")
+        self._convert_button.configure(state='disabled')
 
         # Revert the UI to its launch state
         self.reset_ui_to_launch_state()
 
     def update_file_status(self, file_path: str, status: str, size: str = ''):
         """Update the status and size of a specific file in the queue"""
-        for item_id in self.queue_list.get_children():
-            if self.queue_list.item(item_id, 'values')[0] == os.path.basename(file_path):
-                self.queue_list.item(item_id, values=(os.path.basename(file_path), status, size))
-                break
+        # Rows are keyed by path, so this is a dict write plus a direct
+        # item update with the precomputed basename
+        state = self._queue_state.get(file_path)
+        if state is None:
+            return
+        state['status'] = status
+        state['size'] = size
+        if self.queue_list.exists(file_path):
+            self.queue_list.item(file_path, values=(state['basename'], status, size))
 
     def toggle_batch_processing(self):
         """Toggle between starting and stopping batch processing"""
@@ -423,8 +642,8 @@ class BatchProcessingFrame(ttk.Frame):
         self.current_processing_index = 0
 
         # Update button
-        if hasattr(self.converter, 'convert_button'):
-            self.converter.convert_button.configure(
+        if self._convert_button is not None:
+            self._convert_button.configure(
                 text="Stop",
                 style='Danger.TButton'
             )
@@ -434,16 +653,15 @@ class BatchProcessingFrame(ttk.Frame):
         self.clear_button.configure(state='disabled')
 
         # Ensure the smart panel and tabs are visible for batch processing
-        if hasattr(self.converter, 'smart_panel') and not self.converter.smart_panel.winfo_viewable():
-            self.converter.smart_panel.grid()
+        if self._smart_panel is not None and not self._smart_panel.winfo_viewable():
+            self._smart_panel.grid()
 
         # Make sure tab buttons are visible
-        if hasattr(self.converter, 'tab_buttons_frame') and not self.converter.tab_buttons_frame.winfo_viewable():
-            self.converter.tab_buttons_frame.grid()
+        if self._tab_buttons_frame is not None and not self._tab_buttons_frame.winfo_viewable():
+            self._tab_buttons_frame.grid()
 
         # Switch to batch tab
-        if hasattr(self.converter, 'switch_tab'):
-            self.converter.switch_tab("batch")
+        self.converter.switch_tab("batch")
 
         # Start processing the first file
         self.process_next_file()
@@ -457,10 +675,10 @@ class BatchProcessingFrame(ttk.Frame):
             self.converter.stop_conversion()
 
         # Reset button and enable queue management
-        if hasattr(self.converter, 'convert_button'):
+        if self._convert_button is not None:
             # Set button text based on number of files in queue
             button_text = "Process Batch" if len(self.file_queue) >= 2 else "Convert"
-            self.converter.convert_button.configure(
+            self._convert_button.configure(
                 text=button_text,
                 style='Primary.TButton'
             )
@@ -470,7 +688,7 @@ class BatchProcessingFrame(ttk.Frame):
 
         # Update status of remaining files
         for i in range(self.current_processing_index, len(self.file_queue)):
-            self.update_file_status(self.file_queue[i], "Queued")
+            self.update_file_status(self.file_queue[i], _ST_QUEUED)
 
     def process_next_file(self):
         """Process the next file in the queue"""
@@ -485,7 +703,7 @@ class BatchProcessingFrame(ttk.Frame):
 
         # Get the current file
         current_file = self.file_queue[self.current_processing_index]
-        self.update_file_status(current_file, "Processing")
+        self.update_file_status(current_file, _ST_PROCESSING)
 
         # Log the current file being processed
         self.converter.log(
@@ -508,22 +726,24 @@ class BatchProcessingFrame(ttk.Frame):
                 current_file = self.file_queue[self.current_processing_index]
 
                 if success:
-                    status = "Completed"
+                    status = _ST_COMPLETED
                     # Use the file_path parameter if provided, otherwise use current_file
                     actual_path = file_path if file_path else current_file
-                    # Get file size if not provided
-                    if file_size == 0 and os.path.exists(actual_path):
-                        # Check for the optimized version first
+                    # Get file size if not provided - a single stat per
+                    # candidate instead of separate exists + getsize calls
+                    if file_size == 0:
                         optimized_path = os.path.splitext(actual_path)[0] + '_optimized.gif'
-                        if os.path.exists(optimized_path):
-                            file_size = os.path.getsize(optimized_path)
-                        else:
-                            file_size = os.path.getsize(actual_path)
+                        for candidate in (optimized_path, actual_path):
+                            try:
+                                file_size = os.stat(candidate).st_size
+                                break
+                            except OSError:
+                                continue
 
                     size_text = f"{file_size / 1024:.1f} KB" if file_size > 0 else ""
                     self.converter.log(f"File processed successfully: {size_text}")
                 else:
-                    status = "Failed"
+                    status = _ST_FAILED
                     size_text = ""
                     self.converter.log("File processing failed")
 
@@ -534,49 +754,49 @@ class BatchProcessingFrame(ttk.Frame):
             self.converter.log(f"Moving to next file. Current index: {self.current_processing_index}")
             
             # Make sure the button stays in "Stop" state during batch processing
-            if hasattr(self.converter, 'convert_button') and self.is_processing_batch:
-                self.converter.convert_button.configure(
+            if self._convert_button is not None and self.is_processing_batch:
+                self._convert_button.configure(
                     text="Stop",
                     style='Danger.TButton'
                 )
 
-            # Short delay before processing the next file
-            self.after(1000, self.process_next_file)
+            # Schedule the next file as soon as the event loop is free;
+            # a fixed delay here just adds dead time per file
+            self.after(50, self.process_next_file)
 
         except Exception as e:
             self.converter.log(f"Error in on_file_processed: {str(e)}")
             # Still try to move to the next file
             self.current_processing_index += 1
-            self.after(1000, self.process_next_file)
+            self.after(50, self.process_next_file)
 
     def update_convert_button_text(self):
         """Update the Convert button text based on the number of files in the queue"""
         if self.converter.batch_frame.winfo_viewable():
-            if hasattr(self.converter, 'convert_button'):
+            if self._convert_button is not None:
                 # Set button text based on number of files in queue and processing state
                 if self.is_processing_batch:
-                    self.converter.convert_button.configure(text="Stop")
+                    self._convert_button.configure(text="Stop")
                 else:
                     button_text = "Process Batch" if len(self.file_queue) >= 2 else "Convert"
-                    self.converter.convert_button.configure(text=button_text)
+                    self._convert_button.configure(text=button_text)
 
     def reset_ui_to_launch_state(self):
         """Reset the UI to its launch state, hiding tabs, log window, and batch window"""
-        if hasattr(self.converter, 'smart_panel'):
+        if self._smart_panel is not None:
             # Hide the smart panel
-            self.converter.smart_panel.grid_remove()
+            self._smart_panel.grid_remove()
 
             # Reset active tab
-            if hasattr(self.converter, 'active_tab'):
-                self.converter.active_tab = None
+            self.converter.active_tab = None
 
             # If the batch frame is visible, hide it
-            if hasattr(self.converter, 'batch_frame') and self.converter.batch_frame.winfo_viewable():
-                self.converter.batch_frame.grid_remove()
+            if self.winfo_viewable():
+                self.grid_remove()
 
             # If the log frame is visible, hide it
-            if hasattr(self.converter, 'log_frame') and self.converter.log_frame.winfo_viewable():
-                self.converter.log_frame.grid_remove()
+            if self._log_frame is not None and self._log_frame.winfo_viewable():
+                self._log_frame.grid_remove()
 
             # Reset window size to initial dimensions
             self.converter.update_idletasks()
@@ -590,6 +810,19 @@ class OptimizationParams:
     lossy: int
     frame_skip: int
     output_path: str
+    # Full source frame paths, joined once per conversion and shared by
+    # every attempt; empty means "list the frames directory yourself"
+    frame_files: tuple = ()
+
+
+def _attempt_size_estimate(quality: int, lossy: int, frame_skip: int) -> float:
+    """
+    Rough relative output-size estimate for a parameter triple. GIF size is
+    approximately monotonic in each knob — higher quality grows it, higher
+    lossy and frame skip shrink it — which is all the batch dispatcher needs
+    in order to prune attempts dominated by a result it has already seen.
+    """
+    return (quality / 100) * (1 - lossy / 200) / max(1, frame_skip)
 
 
 def get_resource_path(relative_path):
@@ -628,13 +861,12 @@ class DragDropLabel(ttk.Label):
 
             # Handle multiple files separated by spaces (tkinterdnd2 format)
             # This splits by space but respects quoted paths with spaces
-            import re
             file_paths = []
 
             # Extract paths from the string - they may be quoted or curly-braced
-            for match in re.finditer(r'(?:{([^}]+)})|(?:"([^"]+)")|(?:(\S+))', files_data):
+            for match in _DROP_PATH_RE.finditer(files_data):
                 # Get the matched group (only one will be non-None)
-                path = next(filter(None, match.groups()))
+                path = match.group(1) or match.group(2) or match.group(3)
                 file_paths.append(path)
 
             if not file_paths:
@@ -663,13 +895,14 @@ class DragDropLabel(ttk.Label):
                     if not hasattr(converter, 'batch_frame') or not converter.batch_frame:
                         converter.create_batch_processing_ui()
 
-                    # Add files one by one
-                    for file_path in valid_files:
-                        converter.add_to_batch(file_path)
-
-                    # Update smart panel visibility after adding files
-                    if hasattr(converter, 'batch_frame') and converter.batch_frame:
-                        converter.batch_frame.update_smart_panel_visibility()
+                    # Add files in one bulk pass so the queue UI only
+                    # refreshes once instead of per file
+                    converter.batch_frame.begin_bulk_add()
+                    try:
+                        for file_path in valid_files:
+                            converter.add_to_batch(file_path)
+                    finally:
+                        converter.batch_frame.end_bulk_add()
 
                     # Ensure the convert button is enabled
                     if hasattr(converter, 'convert_button'):
@@ -697,11 +930,11 @@ class DragDropLabel(ttk.Label):
         self.configure(style='Custom.TLabel')
 
     def find_converter(self, widget):
-        """Recursively find the ModernGifConverter instance"""
-        if isinstance(widget, ModernGifConverter):
-            return widget
-        elif widget.master:
-            return self.find_converter(widget.master)
+        """Walk up the widget tree to find the ModernGifConverter instance"""
+        while widget is not None:
+            if isinstance(widget, ModernGifConverter):
+                return widget
+            widget = widget.master
         return None
 
     def validate_file(self, file_path: str) -> bool:
@@ -714,17 +947,143 @@ class DragDropLabel(ttk.Label):
             return False
 
 
+def _save_rgba_png(data: bytes, size, path: str):
+    """Encode raw RGBA bytes as a PNG (worker for parallel frame dumps)."""
+    Image.frombytes('RGBA', size, data).save(path, 'PNG', compress_level=1)
+
+
+def _load_frame_alpha(frame_path: str):
+    """Decode a frame and return its alpha channel as a NumPy array."""
+    import numpy as np
+
+    with Image.open(frame_path) as frame:
+        if frame.mode != 'RGBA':
+            frame = frame.convert('RGBA')
+        # Copy the channel out so the full RGBA buffer can be freed
+        return np.asarray(frame)[..., 3].copy()
+
+
+def _write_frame_alpha(frame_path: str, new_alpha):
+    """Rewrite a frame's alpha channel in place."""
+    import numpy as np
+
+    with Image.open(frame_path) as frame:
+        if frame.mode != 'RGBA':
+            frame = frame.convert('RGBA')
+        out = np.asarray(frame).copy()
+    out[..., 3] = new_alpha
+    # gifski consumes these PNGs immediately, so favor encode speed
+    Image.fromarray(out, 'RGBA').save(frame_path, 'PNG', compress_level=1)
+
+
 class ModernGifConverter(ttk.Frame):
+    # Rolling cap on the log widget: once past LOG_MAX_LINES the oldest
+    # LOG_TRIM_CHUNK-plus-excess lines are dropped in a single delete, so
+    # multi-hour batch runs don't make every insert progressively slower
+    LOG_MAX_LINES = 2000
+    LOG_TRIM_CHUNK = 500
+
+    # Decoded logo animation, shared across instances: the per-frame
+    # LANCZOS resize is paid at most once per process. Frames are kept as
+    # PIL images; only the currently displayed frame is converted to a Tk
+    # PhotoImage (in animate_logo), so the Tk interpreter holds one copy
+    # of the logo instead of every frame
+    _logo_frames = None
+    _logo_durations = None
+
+    @classmethod
+    def _load_logo(cls):
+        """Decode and scale the animated logo once, caching on the class."""
+        if cls._logo_frames is not None:
+            return cls._logo_frames, cls._logo_durations
+
+        logo_path = get_resource_path('logo.gif')
+        gif = Image.open(logo_path)
+        frames = []
+        durations = []
+
+        try:
+            while True:
+                # Copy the current frame
+                frame = gif.copy()
+                # Convert to RGBA if necessary and resize. Only the first
+                # frame (shown while the window settles) gets the expensive
+                # LANCZOS kernel; animation frames flash by in ~100 ms, so
+                # BILINEAR is indistinguishable at a quarter of the cost
+                if frame.mode != 'RGBA':
+                    frame = frame.convert('RGBA')
+                resampler = Image.Resampling.LANCZOS if not frames else Image.Resampling.BILINEAR
+                frame = frame.resize((470, 185), resampler)
+                # Store the PIL frame, collecting the duration (in
+                # milliseconds) in the same pass - a second seek() loop
+                # would re-decode every frame just to read it
+                frames.append(frame)
+                durations.append(gif.info.get('duration', 100))  # Default to 100ms if not specified
+                # Move to next frame
+                gif.seek(len(frames))
+        except EOFError:
+            pass  # We've hit the end of the frames
+
+        cls._logo_frames = frames
+        cls._logo_durations = durations
+        return frames, durations
+
     def __init__(self, master):
         super().__init__(master)
-        self.max_parallel_jobs = min(os.cpu_count() or 1, 4)
+        self.max_parallel_jobs = _MAX_PARALLEL_JOBS
         self.executor = concurrent.futures.ThreadPoolExecutor(max_workers=self.max_parallel_jobs)
+
+        # One long-lived asyncio loop on a background thread drives the
+        # batch conversion pipeline, instead of a fresh thread + event
+        # loop per queued file
+        self._async_loop = asyncio.new_event_loop()
+        threading.Thread(target=self._async_loop.run_forever, daemon=True).start()
+
         self.is_converting = False
+        # Two views of one cancellation flag: the threading.Event is
+        # checked from worker threads and between pipeline stages, the
+        # asyncio.Event lets subprocess waits react without polling.
+        # stop/start go through _signal_cancel/_reset_cancel to keep them
+        # in step
         self.cancellation_event = threading.Event()
+        self._cancel_async_event = asyncio.Event()
+
+        # Sorted frame listings keyed by directory; the pipeline stages
+        # (transparency probe, alpha pass, every optimization attempt)
+        # all want the same listing, so scan each frames dir once
+        self._frames_cache: dict = {}
+
+        # Bounds concurrent optimization attempts (see
+        # try_optimization_params); created lazily on the background loop
+        self._attempt_semaphore = None
         self.style = ttk.Style("darkly")
         self.setup_styles()
         self.create_widgets()
 
+        # Log messages are queued and drained on the Tk thread - Tcl is
+        # not thread-safe, and the conversion pipeline logs from the
+        # asyncio/worker threads. Draining at ~20 Hz also coalesces
+        # progress bursts into a single widget update
+        self._log_queue = queue.Queue()
+        self.after(50, self._drain_log_queue)
+
+        # Debounced redraw flag (see _request_redraw)
+        self._redraw_pending = False
+
+    def _request_redraw(self):
+        """
+        Coalesce UI refreshes into a single update_idletasks per idle
+        cycle. Dropping many files at once otherwise triggers a full Tk
+        redraw per file.
+        """
+        if not self._redraw_pending:
+            self._redraw_pending = True
+            self.after_idle(self._do_redraw)
+
+    def _do_redraw(self):
+        self._redraw_pending = False
+        self.update_idletasks()
+
     def create_batch_processing_ui(self):
         """Create the batch processing UI elements"""
         # Create batch frame as a direct child of the panel_content frame
@@ -779,15 +1138,14 @@ class ModernGifConverter(ttk.Frame):
             if len(self.batch_frame.file_queue) == 0 and self.selected_file and self.selected_file != file_path:
                 self.batch_frame.add_file_to_queue(self.selected_file)
 
-            # Now add the new file
+            # Now add the new file; basename is computed once for either label
+            filename = os.path.basename(file_path)
             if self.batch_frame.add_file_to_queue(file_path):
-                filename = os.path.basename(file_path)
                 self.file_label.configure(
                     text=f"Added to queue: {filename}",
                     foreground='#995FB6'
                 )
             else:
-                filename = os.path.basename(file_path)
                 self.file_label.configure(
                     text=f"Already in queue: {filename}",
                     foreground='#ff9900'
@@ -827,8 +1185,8 @@ class ModernGifConverter(ttk.Frame):
                 foreground='#995FB6'
             )
 
-            # Update the UI immediately
-            self.update()
+            # Refresh the UI on the next idle cycle (debounced)
+            self._request_redraw()
 
         except Exception as e:
             print(f"Error setting file: {str(e)}")
@@ -881,33 +1239,26 @@ class ModernGifConverter(ttk.Frame):
         self.suppress_dialogs = True
 
         # Reset cancellation flag
-        self.cancellation_event.clear()
+        self._reset_cancel()
 
-        # Start conversion in a separate thread
+        # Schedule the conversion on the shared background loop
         self.is_converting = True
-        self.conversion_thread = threading.Thread(
-            target=self.run_batch_conversion,
-            args=(self.selected_file, desired_size),
-            daemon=True
+        asyncio.run_coroutine_threadsafe(
+            self.run_batch_conversion(self.selected_file, desired_size),
+            self._async_loop
         )
-        self.conversion_thread.start()
 
-    def run_batch_conversion(self, input_path, desired_size):
-        """Run conversion for batch processing"""
+    async def run_batch_conversion(self, input_path, desired_size):
+        """Run conversion for batch processing on the shared asyncio loop"""
         success = False
-        output_file_size = 0
+        file_size = 0
+        output_path = None
         try:
             self.log(f"Running batch conversion for {os.path.basename(input_path)}")
 
-            # Create event loop in this thread
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-
-            # Run the conversion
-            output_path = os.path.splitext(input_path)[0] + '_optimized.gif'
-            success, file_size = loop.run_until_complete(
-                self.convert_to_gif_batch(input_path, desired_size)
-            )
+            # Run the conversion; the batch helper hands back the output
+            # path so it is computed (and stat'ed) exactly once
+            success, file_size, output_path = await self.convert_to_gif_batch(input_path, desired_size)
 
             # Log the completion status
             if success:
@@ -935,7 +1286,6 @@ class ModernGifConverter(ttk.Frame):
             
             # Call the callback with success status and file size
             if hasattr(self, 'batch_callback') and self.batch_callback:
-                output_path = os.path.splitext(input_path)[0] + '_optimized.gif'
                 # Use master.after to ensure this runs in the main thread
                 self.master.after(10, lambda: self.batch_callback(success, output_path, file_size))
             else:
@@ -944,28 +1294,32 @@ class ModernGifConverter(ttk.Frame):
             # Clear suppress_dialogs flag
             self.suppress_dialogs = False
 
-    # 3. Update convert_to_gif_batch to return both success status and output path
+    # 3. Update convert_to_gif_batch to return success status, size and output path
     async def convert_to_gif_batch(self, input_path, desired_size):
         """Modified conversion method that returns success/failure for batch processing"""
         self.log(f"Starting convert_to_gif_batch for {os.path.basename(input_path)}")
+        # Compute the output path once; callers reuse it instead of
+        # re-deriving and re-stat'ing the same file
+        output_path = os.path.splitext(input_path)[0] + '_optimized.gif'
+
         # Reuse the existing convert_to_gif method, but track success
         try:
             # Call the original method with suppress_dialogs already set
             await self.convert_to_gif(input_path, desired_size)
 
-            # Determine success - check if output file exists
-            output_path = os.path.splitext(input_path)[0] + '_optimized.gif'
-            if os.path.exists(output_path):
-                file_size = os.path.getsize(output_path)
-                self.log(f"Batch conversion successful, created: {output_path} ({file_size / 1024:.1f} KB)")
-                return True, file_size
+            # Determine success - a single stat covers existence and size
+            try:
+                file_size = os.stat(output_path).st_size
+            except OSError:
+                self.log("Batch conversion failed - output file not found")
+                return False, 0, output_path
 
-            self.log("Batch conversion failed - output file not found")
-            return False, 0
+            self.log(f"Batch conversion successful, created: {output_path} ({file_size / 1024:.1f} KB)")
+            return True, file_size, output_path
 
         except Exception as e:
             self.log(f"Exception in batch conversion: {str(e)}")
-            return False, 0
+            return False, 0, output_path
 
     @staticmethod
     def run_subprocess_hidden(command: list, **kwargs):
@@ -980,39 +1334,15 @@ class ModernGifConverter(ttk.Frame):
         if binary_name.split('.')[0] not in allowed_binaries:
             raise ValueError(f"Unauthorized binary: {binary_name}")
 
-        # Windows: hide console window using STARTUPINFO and creation flags
+        # Windows: hide console window using the precomputed settings
         if sys.platform == 'win32':
-            startupinfo = subprocess.STARTUPINFO()
-            startupinfo.dwFlags |= subprocess.STARTF_USESHOWWINDOW
-            startupinfo.wShowWindow = subprocess.SW_HIDE
-            kwargs['startupinfo'] = startupinfo
-            # Use CREATE_NO_WINDOW (and SW_HIDE if frozen) to ensure no visible console
-            if getattr(sys, 'frozen', False):
-                kwargs['creationflags'] = CREATE_NO_WINDOW | SW_HIDE
-            else:
-                kwargs['creationflags'] = CREATE_NO_WINDOW
+            kwargs['startupinfo'] = _WIN_STARTUPINFO
+            kwargs['creationflags'] = _WIN_CREATIONFLAGS
 
-        # macOS (or other Unix): ensure the binary is executable
+        # macOS (or other Unix): ensure the binary is executable (once per
+        # binary per process, not per spawn)
         else:
-            if os.path.exists(command[0]):
-                try:
-                    os.chmod(command[0], 0o755)  # make sure the binary is executable
-                    # Also ensure the containing directory has execute permission (allow traversal)
-                    binary_dir = os.path.dirname(command[0])
-                    if binary_dir:
-                        os.chmod(binary_dir, 0o755)
-                except Exception as e:
-                    print(f"Warning: Could not set executable permissions on {binary_name}: {e}")
-            # On macOS ARM64, warn if an x86_64 binary is being used (optional diagnostic)
-            if sys.platform == 'darwin' and platform.machine() == 'arm64':
-                try:
-                    result = subprocess.run(['file', command[0]], stdout=subprocess.PIPE, stderr=subprocess.PIPE,
-                                            text=True)
-                    # If the output of `file` does not mention 'arm64' or 'Mach-O 64-bit arm64', it might be an Intel binary
-                    if result.returncode == 0 and 'arm64' not in result.stdout and 'Rosetta' not in result.stdout:
-                        print(f"Warning: {binary_name} may not be ARM64-optimized (running via Rosetta)")
-                except Exception:
-                    pass  # If the `file` command isn’t available or fails, ignore this check
+            _ensure_binary_ready(command[0])
 
         # If the command is ffprobe, we need its output (do not create a temp file, just capture output directly)
         if os.path.basename(command[0]).lower().startswith('ffprobe'):
@@ -1020,33 +1350,58 @@ class ModernGifConverter(ttk.Frame):
             kwargs.setdefault('stderr', subprocess.PIPE)
             return subprocess.run(command, **kwargs)
 
-        # For other commands, run with stdout/stderr hidden by default
-        kwargs.setdefault('stdout', subprocess.PIPE)
-        kwargs.setdefault('stderr', subprocess.PIPE)
+        # For other commands, discard stdout and keep only a bounded tail of
+        # stderr - long encoder runs emit thousands of progress lines and
+        # only the last few matter for error reporting
+        kwargs.setdefault('stdout', subprocess.DEVNULL)
+        kwargs.pop('stderr', None)
         temp_dir = None
         original_output = None
         try:
-            # If an output file is specified with -o/--output, write to a temp file to avoid partial results on failure
-            if '-o' in command or '--output' in command:
-                temp_dir = tempfile.mkdtemp(prefix='giflight_')
-                # Locate the output path argument and replace it with a temp path
-                out_flag = '-o' if '-o' in command else '--output'
-                idx = command.index(out_flag) + 1
-                if idx < len(command):
-                    original_output = command[idx]
-                    temp_output = os.path.join(temp_dir, os.path.basename(original_output))
-                    command[idx] = temp_output
-            # Run the subprocess
-            result = subprocess.run(command, **kwargs)
-            # If we wrote to a temp file and it exists, move it to the intended location
+            # If an output file is specified with -o/--output, write to a temp
+            # file to avoid partial results on failure. One enumerate pass
+            # finds the flag instead of two membership scans plus index()
+            out_idx = next(
+                (i + 1 for i, arg in enumerate(command) if arg in ('-o', '--output')),
+                None
+            )
+            if out_idx is not None and out_idx < len(command):
+                original_output = command[out_idx]
+                # Keep the temp dir next to the final output so the
+                # rename below stays on one filesystem (os.replace
+                # would otherwise fail, and shutil.move would copy)
+                temp_dir = tempfile.mkdtemp(
+                    prefix='giflight_', dir=os.path.dirname(original_output) or None
+                )
+                temp_output = os.path.join(temp_dir, os.path.basename(original_output))
+                command[out_idx] = temp_output
+            # Run the subprocess, draining stderr into a small ring buffer
+            tail = collections.deque(maxlen=32)
+            proc = subprocess.Popen(command, stderr=subprocess.PIPE, **kwargs)
+
+            def _drain_stderr():
+                for line in proc.stderr:
+                    tail.append(line)
+
+            reader = threading.Thread(target=_drain_stderr, daemon=True)
+            reader.start()
+            proc.wait()
+            reader.join()
+            result = subprocess.CompletedProcess(command, proc.returncode, None, b''.join(tail))
+
+            # If we wrote to a temp file and it exists, rename it into place
+            # (atomic, same filesystem - never a byte copy)
             if temp_dir and original_output and os.path.isfile(temp_output):
-                shutil.move(temp_output, original_output)
+                os.replace(temp_output, original_output)
             return result
         finally:
-            # Clean up any temporary directory
-            if temp_dir and os.path.isdir(temp_dir):
+            # Clean up any temporary directory; attempting the removal and
+            # ignoring a missing dir saves the pre-flight stat
+            if temp_dir:
                 try:
                     shutil.rmtree(temp_dir)
+                except FileNotFoundError:
+                    pass
                 except Exception as e:
                     print(f"Error cleaning up temporary directory: {e}")
 
@@ -1059,6 +1414,16 @@ class ModernGifConverter(ttk.Frame):
         try:
             # Get original file size before optimization
             original_size = os.path.getsize(input_path)
+
+            # Already-tiny GIFs gain nothing from a full decode/re-encode
+            # pass, so skip the subprocess entirely
+            if original_size < _SMALL_GIF_THRESHOLD:
+                self.log(
+                    f"Skipping final optimization pass: file is already small ({original_size / 1024:.1f} KB)")
+                if os.path.abspath(input_path) != os.path.abspath(output_path):
+                    shutil.copyfile(input_path, output_path)
+                return output_path
+
             self.log(
                 f"Applying final optimization pass with ImageMagick (original size: {original_size / 1024:.1f} KB)...")
 
@@ -1083,61 +1448,64 @@ class ModernGifConverter(ttk.Frame):
                 temp_output
             ]
 
-            # Platform-specific subprocess settings
+            # Platform-specific subprocess settings; stdout is discarded and
+            # stderr is streamed into a bounded tail rather than buffered whole
             if sys.platform == 'win32':
-                startupinfo = subprocess.STARTUPINFO()
-                startupinfo.dwFlags |= subprocess.STARTF_USESHOWWINDOW
-                startupinfo.wShowWindow = subprocess.SW_HIDE
-                creationflags = CREATE_NO_WINDOW | SW_HIDE if getattr(sys, 'frozen',
-                                                                      False) else CREATE_NO_WINDOW
                 process = await asyncio.create_subprocess_exec(
-                    *command, stdout=subprocess.PIPE, stderr=subprocess.PIPE,
-                    startupinfo=startupinfo, creationflags=creationflags
+                    *command, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE,
+                    startupinfo=_WIN_STARTUPINFO, creationflags=_WIN_CREATIONFLAGS
                 )
             else:
                 process = await asyncio.create_subprocess_exec(
-                    *command, stdout=subprocess.PIPE, stderr=subprocess.PIPE
+                    *command, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE
                 )
 
-            # Set up progress indicator
-            max_wait_time = 30  # Maximum expected seconds for optimization
-            progress_steps = 20  # Number of progress indicators to show
-
-            # Start animation loop
-            for i in range(progress_steps):
-                if process.returncode is not None:
-                    break
-
-                progress = i / progress_steps
-                bar_width = 15
-                filled_length = int(bar_width * progress)
-                bar = '█' * filled_length + '░' * (bar_width - filled_length)
-                self.log(f"Optimizing: [{bar}] {int(progress * 100)}%", replace_last=True)
-
-                try:
-                    # Wait a bit, but allow for early termination if process completes
-                    await asyncio.wait_for(asyncio.shield(process.wait()), timeout=max_wait_time / progress_steps)
-                    break
-                except asyncio.TimeoutError:
-                    # Process still running, continue animation
-                    pass
+            # Drain stderr concurrently, keeping only the last few lines for
+            # error reporting; this also prevents pipe-fill stalls on
+            # chatty ImageMagick runs
+            async def _stderr_tail():
+                tail = collections.deque(maxlen=32)
+                async for line in process.stderr:
+                    tail.append(line)
+                return tail
+
+            stderr_task = asyncio.ensure_future(_stderr_tail())
+
+            # Progress indicator: one pending wait task polled with plain
+            # asyncio.wait timeouts, rather than 20 rounds of
+            # wait_for + shield each building a fresh task and TimeoutError
+            max_wait_time = 30  # Expected seconds; scales the progress estimate
+            wait_task = asyncio.ensure_future(process.wait())
+            start_time = time.monotonic()
+
+            while not wait_task.done():
+                progress = min((time.monotonic() - start_time) / max_wait_time, 0.95)
+                filled_length = int(_BAR_WIDTH * progress)
+                self.log(f"Optimizing: [{_BARS[filled_length]}] {int(progress * 100)}%", replace_last=True)
+                await asyncio.wait((wait_task,), timeout=1.5)
 
             # Wait for completion
-            stdout, stderr = await process.communicate()
+            await wait_task
+            stderr_tail = await stderr_task
 
             # Completion progress bar
-            self.log(f"Optimizing: [{'█' * bar_width}] 100%", replace_last=True)
+            self.log(f"Optimizing: [{_BARS[-1]}] 100%", replace_last=True)
 
             # Check for errors
             if process.returncode != 0:
-                error_msg = stderr.decode() if stderr else "No error details available"
+                error_msg = b''.join(stderr_tail).decode() if stderr_tail else "No error details available"
                 raise RuntimeError(f"Optimization failed: {error_msg}")
 
             if not os.path.exists(temp_output):
                 raise RuntimeError("ImageMagick did not produce an output file")
 
-            # Replace the original output file with the optimized result
-            shutil.move(temp_output, output_path)
+            # Replace the original output file with the optimized result;
+            # os.replace renames atomically instead of copying. Fall back to
+            # shutil.move if the temp dir is on another filesystem (tmpfs)
+            try:
+                os.replace(temp_output, output_path)
+            except OSError:
+                shutil.move(temp_output, output_path)
 
             # Get final size for logging
             if os.path.exists(output_path):
@@ -1149,11 +1517,14 @@ class ModernGifConverter(ttk.Frame):
 
             return output_path
         finally:
-            # Cleanup: remove temp file if it still exists
-            if temp_output and os.path.exists(temp_output):
+            # Cleanup: remove temp file if it still exists (one syscall -
+            # a missing file is the normal case after the rename above)
+            if temp_output:
                 try:
                     os.remove(temp_output)
-                except Exception as e:
+                except FileNotFoundError:
+                    pass
+                except OSError as e:
                     self.log(f"Error removing temporary file: {e}")
 
     def toggle_conversion(self):
@@ -1186,7 +1557,7 @@ class ModernGifConverter(ttk.Frame):
                 desired_size = None
 
             # Reset cancellation flag
-            self.cancellation_event.clear()
+            self._reset_cancel()
 
             # Update button appearance
             self.convert_button.configure(
@@ -1203,13 +1574,15 @@ class ModernGifConverter(ttk.Frame):
 
             self.is_converting = True
 
-            # Start conversion in a separate thread
-            self.conversion_thread = threading.Thread(
-                target=self.run_conversion,
-                args=(self.selected_file, desired_size),
-                daemon=True
+            # Run on the shared background loop; completion is marshalled
+            # back to the Tk thread via after_idle, so no joiner thread
+            future = asyncio.run_coroutine_threadsafe(
+                self.convert_to_gif(self.selected_file, desired_size),
+                self._async_loop
+            )
+            future.add_done_callback(
+                lambda f: self.master.after_idle(self.on_conversion_done, f)
             )
-            self.conversion_thread.start()
         else:
             # Stop conversion
             if self.batch_frame.is_processing_batch:
@@ -1221,21 +1594,21 @@ class ModernGifConverter(ttk.Frame):
         """Stop the ongoing conversion process"""
         if self.is_converting:
             self.log("\nStopping conversion...")
-            self.cancellation_event.set()
+            self._signal_cancel()
 
-            # Don't disable the button, just change its appearance
+            # Don't disable the button, just change its appearance; the
+            # conversion future's done callback restores the final state
             self.convert_button.configure(
                 text="Stopping...",
                 style='Danger.TButton'
             )
 
-            # Wait for conversion thread to finish in a separate thread
-            threading.Thread(target=self.wait_for_conversion_end, daemon=True).start()
-
-    def wait_for_conversion_end(self):
-        """Wait for conversion to end and restore button state"""
-        if hasattr(self, 'conversion_thread'):
-            self.conversion_thread.join()
+    def on_conversion_done(self, future):
+        """Restore UI state after a single-file conversion (runs on Tk thread)"""
+        try:
+            future.result()
+        except Exception as e:
+            self.log(f"Error during conversion: {str(e)}")
 
         # Only reset button if we're not in batch processing mode
         # or if batch processing has completed
@@ -1251,81 +1624,14 @@ class ModernGifConverter(ttk.Frame):
                 style='Primary.TButton',
                 state='normal'
             )
-        
+
         self.is_converting = False
-        self.update()
 
     def setup_styles(self):
         """Configure custom styles for widgets"""
-        # Main background color
         self.style = ttk.Style("darkly")
-        self.style.configure('TFrame', background='#1a1a1a')
-
-        # Basic label style (important to set this first)
-        self.style.configure('TLabel',
-                             background='#1a1a1a',
-                             foreground='#ffffff')
-
-        # Drop zone container style
-        self.style.configure('DropZone.TFrame',
-                             background='#1a1a1a',
-                             borderwidth=2,
-                             relief='solid')
-
-        # Custom style specifically for the drop label - default state
-        self.style.configure('Custom.TLabel',
-                             background='#2d2d2d',
-                             foreground='#ffffff',
-                             font=('Segoe UI', 12),
-                             borderwidth=2,
-                             relief='solid',
-                             padding=20,
-                             anchor='center',
-                             justify='center')
-
-        # Hover state style also needs the centering
-        self.style.configure('Custom.Hover.TLabel',
-                             background='#3d3d3d',
-                             foreground='#ffffff',
-                             font=('Segoe UI', 12, 'bold'),
-                             borderwidth=2,
-                             relief='solid',
-                             padding=20,
-                             anchor='center',
-                             justify='center')
-
-        # Rest of your styles...
-        self.style.configure('Success.TLabel',
-                             background='#1a1a1a',
-                             foreground='#28a745')
-
-        self.style.configure('Error.TLabel',
-                             background='#1a1a1a',
-                             foreground='#dc3545')
-
-        self.style.configure('Primary.TButton',
-                             background='#007bff',
-                             foreground='white',
-                             font=('Segoe UI', 10, 'bold'),
-                             padding=(5, 2))
-
-        self.style.configure('TEntry',
-                             fieldbackground='#2d2d2d',
-                             foreground='white',
-                             insertcolor='white')
-
-        self.style.configure('TProgressbar',
-                             background='#007bff',
-                             troughcolor='#2d2d2d',
-                             borderwidth=0,
-                             thickness=10)
-
-        # Add new style for Stop button
-        self.style.configure('Danger.TButton',
-                             background='#dc3545',
-                             foreground='white',
-                             font=('Segoe UI', 10, 'bold'),
-                             padding=(5, 2))
+        for name, opts in _STYLES.items():
+            self.style.configure(name, **opts)
 
     # Find all references to content_frame in the create_widgets method
     # and update them to self.content_frame
@@ -1339,40 +1645,19 @@ class ModernGifConverter(ttk.Frame):
         logo_frame = ttk.Frame(self)
         logo_frame.grid(row=0, column=0, pady=(0, 0))
 
-        # Load and display animated logo
+        # Load and display animated logo (decoded once per process and
+        # shared across instances via the class-level cache)
         try:
-            logo_path = get_resource_path('logo.gif')  # Changed from logo.png to logo.gif
-            self.gif = Image.open(logo_path)
-
-            # Get the number of frames in the GIF
-            self.gif_frames = []
+            self.gif_frames, self.frame_durations = self._load_logo()
             self.current_frame = 0
 
-            try:
-                while True:
-                    # Copy the current frame
-                    frame = self.gif.copy()
-                    # Convert to RGBA if necessary and resize
-                    if frame.mode != 'RGBA':
-                        frame = frame.convert('RGBA')
-                    frame = frame.resize((470, 185), Image.Resampling.LANCZOS)
-                    # Create PhotoImage and store it
-                    photo = ImageTk.PhotoImage(frame)
-                    self.gif_frames.append(photo)
-                    # Move to next frame
-                    self.gif.seek(len(self.gif_frames))
-            except EOFError:
-                pass  # We've hit the end of the frames
-
-            # Get frame durations (in milliseconds)
-            self.frame_durations = []
-            for frame in range(len(self.gif_frames)):
-                self.gif.seek(frame)
-                self.frame_durations.append(self.gif.info.get('duration', 100))  # Default to 100ms if not specified
-
-            # Create label for displaying the animated logo
-            self.logo_label = ttk.Label(logo_frame)
-            self.logo_label.grid(pady=(0, 10))
+            # Display the animation on a plain Canvas: itemconfig is a
+            # direct display-list update, where a ttk.Label configure
+            # walks the style engine and can relayout on every tick
+            self.logo_canvas = tk.Canvas(logo_frame, width=470, height=185,
+                                         bg='#1a1a1a', highlightthickness=0)
+            self.logo_canvas.grid(pady=(0, 10))
+            self._logo_item = self.logo_canvas.create_image(0, 0, anchor='nw')
 
             # Start the animation
             self.animate_logo()
@@ -1542,6 +1827,7 @@ class ModernGifConverter(ttk.Frame):
         self.pulse_alpha = 0
         self.pulse_increasing = True
         self.pulse_animation_active = False
+        self._last_pulse_color = None
 
         # Store the selected file path
         self.selected_file: Optional[str] = None
@@ -1558,9 +1844,18 @@ class ModernGifConverter(ttk.Frame):
         if not hasattr(self, 'gif_frames') or not self.gif_frames:
             return
 
+        # The logo is decorative; while a conversion runs it competes with
+        # log flushes and queue updates for main-thread cycles, so idle at
+        # a slow poll until the conversion finishes
+        if self.is_converting:
+            self.after(250, self.animate_logo)
+            return
+
         try:
-            # Update the frame
-            self.logo_label.configure(image=self.gif_frames[self.current_frame])
+            # Convert just the current frame to a PhotoImage; holding a
+            # single reference caps the Tk-side logo memory at one frame
+            self._current_logo_photo = ImageTk.PhotoImage(self.gif_frames[self.current_frame])
+            self.logo_canvas.itemconfig(self._logo_item, image=self._current_logo_photo)
             # Get frame duration (with fallback to 100ms)
             frame_duration = 100
             if hasattr(self, 'frame_durations') and self.frame_durations and len(
@@ -1632,18 +1927,49 @@ class ModernGifConverter(ttk.Frame):
         root.geometry(f"{current_width}x{new_height}")  # Set new size
 
     def log(self, message: str, replace_last: bool = False):
-        """Add message to log area"""
-        if replace_last:
-            # Delete last line
-            self.log_text.delete("end-2c linestart", "end-1c")
-        self.log_text.insert('end', message + '\n')
-        self.log_text.see('end')
-        
-        # Only update the UI occasionally for progress messages to reduce jittering
-        if not replace_last or not message.startswith("Processing frames:"):
-            self.update()
+        """Queue a message for the log area (safe to call from any thread)"""
+        self._log_queue.put((message, replace_last))
+
+    def _drain_log_queue(self):
+        """Apply queued log messages on the Tk thread, one redraw per batch"""
+        applied = False
+        pending = []  # consecutive plain lines, flushed as one insert
+        while True:
+            try:
+                message, replace_last = self._log_queue.get_nowait()
+            except queue.Empty:
+                break
+            if replace_last:
+                # Flush batched lines first so the delete hits the right line
+                if pending:
+                    self.log_text.insert('end', ''.join(pending))
+                    pending.clear()
+                self.log_text.delete("end-2c linestart", "end-1c")
+                self.log_text.insert('end', message + '\n')
+            else:
+                pending.append(message + '\n')
+            applied = True
+
+        if pending:
+            self.log_text.insert('end', ''.join(pending))
+        if applied:
+            # Keep the widget bounded: Tk Text inserts slow down as the
+            # line count climbs, so trim the oldest lines in one delete
+            # once the cap is exceeded
+            line_count = int(self.log_text.index('end-1c').split('.')[0])
+            if line_count > self.LOG_MAX_LINES:
+                excess = line_count - self.LOG_MAX_LINES + self.LOG_TRIM_CHUNK
+                self.log_text.delete('1.0', f'{excess}.0')
+            self.log_text.see('end')
+
+        self.after(50, self._drain_log_queue)
 
     def check_dependencies(self):
+        # Conversions spawn the bundled binaries, so the startup
+        # permission fixup must be done by now; by the time the user has
+        # picked a file it long since is, making this join free
+        wait_for_permission_fixup()
+
         missing = []
         if not os.path.exists(FFMPEG_PATH):
             missing.append("FFmpeg")
@@ -1654,6 +1980,13 @@ class ModernGifConverter(ttk.Frame):
         if not os.path.exists(IMAGEMAGICK_PATH):
             missing.append("ImageMagick")
 
+        # Warm the once-per-binary permission check here so the first
+        # conversion doesn't pay it mid-pipeline
+        if not missing and sys.platform != 'win32':
+            for binary in (FFMPEG_PATH, FFPROBE_PATH, GIFSKI_PATH,
+                           GIFSICLE_PATH, IMAGEMAGICK_PATH):
+                _ensure_binary_ready(binary)
+
         if missing:
             messagebox.showerror(
                 "Missing Dependencies",
@@ -1689,34 +2022,53 @@ class ModernGifConverter(ttk.Frame):
         self.show_log()
         self.convert_button.configure(state='disabled')
 
-        # Start conversion in a separate thread
-        self.conversion_thread = threading.Thread(
-            target=self.run_conversion,
-            args=(self.selected_file, desired_size),
-            daemon=True
+        # Run on the shared background loop instead of a per-conversion
+        # thread with its own event loop
+        self.is_converting = True
+        future = asyncio.run_coroutine_threadsafe(
+            self.convert_to_gif(self.selected_file, desired_size),
+            self._async_loop
+        )
+        future.add_done_callback(
+            lambda f: self.master.after_idle(self.on_conversion_done, f)
         )
-        self.conversion_thread.start()
-
-    def run_conversion(self, input_path: str, desired_size: int):
-        """Run the conversion process"""
-        try:
-            # Create event loop in this thread
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
 
-            # Run the conversion
-            loop.run_until_complete(
-                self.convert_to_gif(input_path, desired_size)
-            )
+    def _signal_cancel(self):
+        """Set both cancellation flags (called from the Tk thread)."""
+        self.cancellation_event.set()
+        self._async_loop.call_soon_threadsafe(self._cancel_async_event.set)
 
-        except Exception as e:
-            self.log(f"Error during conversion: {str(e)}")
+    def _reset_cancel(self):
+        """Clear both cancellation flags before starting a conversion."""
+        self.cancellation_event.clear()
+        self._async_loop.call_soon_threadsafe(self._cancel_async_event.clear)
 
+    async def _wait_for_process(self, process) -> bool:
+        """
+        Await a subprocess, racing user cancellation instead of polling.
+        Returns True when the process exits on its own; terminates it and
+        returns False if the user cancels first.
+        """
+        wait_task = asyncio.ensure_future(process.wait())
+        cancel_task = asyncio.ensure_future(self._cancel_async_event.wait())
+        try:
+            await asyncio.wait((wait_task, cancel_task),
+                               return_when=asyncio.FIRST_COMPLETED)
+        except asyncio.CancelledError:
+            # The attempt itself was cancelled (e.g. a good-enough result
+            # landed); don't leave the subprocess running
+            process.terminate()
+            raise
         finally:
-            self.convert_button.configure(state='normal')
+            cancel_task.cancel()
+        if not wait_task.done():
+            process.terminate()
+            await wait_task
+            return False
+        return True
 
     async def run_in_executor(self, func, *args):
-        loop = asyncio.get_event_loop()
+        loop = asyncio.get_running_loop()
         return await loop.run_in_executor(self.executor, func, *args)
 
     async def run_subprocess(self, command: list):
@@ -1732,23 +2084,13 @@ class ModernGifConverter(ttk.Frame):
         }
 
         if sys.platform == 'win32':
-            startupinfo = subprocess.STARTUPINFO()
-            startupinfo.dwFlags |= subprocess.STARTF_USESHOWWINDOW
-            startupinfo.wShowWindow = subprocess.SW_HIDE
-            subprocess_kwargs['startupinfo'] = startupinfo
-            # Use CREATE_NO_WINDOW (and SW_HIDE if frozen) to ensure no visible console
-            if getattr(sys, 'frozen', False):
-                subprocess_kwargs['creationflags'] = CREATE_NO_WINDOW | SW_HIDE
-            else:
-                subprocess_kwargs['creationflags'] = CREATE_NO_WINDOW
+            subprocess_kwargs['startupinfo'] = _WIN_STARTUPINFO
+            subprocess_kwargs['creationflags'] = _WIN_CREATIONFLAGS
 
         # macOS (or other Unix): ensure the target binary is executable
         else:
-            if command and os.path.exists(command[0]):
-                try:
-                    os.chmod(command[0], 0o755)
-                except Exception as e:
-                    print(f"Warning: Could not set executable permissions on {command[0]}: {e}")
+            if command:
+                _ensure_binary_ready(command[0])
         # Run the process asynchronously
         process = await asyncio.create_subprocess_exec(*command, **subprocess_kwargs)
         stdout, stderr = await process.communicate()
@@ -1759,115 +2101,115 @@ class ModernGifConverter(ttk.Frame):
         return stdout.decode() if stdout else ""
 
     # Update the extract_frames method
-    def extract_frames(self, video_path: str, frames_dir: str, fps: int):
+    async def extract_frames(self, video_path: str, frames_dir: str, fps: int):
         """
-        Extracts frames from a video using FFmpeg. Ensures FFmpeg runs with hidden
-        console on Windows and is executable on macOS.
+        Extracts frames from a video using FFmpeg. Runs on the event loop via
+        asyncio's subprocess support, so a long extraction doesn't tie up an
+        executor worker thread while ffmpeg does the work.
         """
         ffmpeg_cmd = [
             FFMPEG_PATH,
+            '-threads', str(_FFMPEG_THREADS),
             '-i', video_path,
             '-vf', f'fps={fps}',
             '-pix_fmt', 'rgba',
+            # These PNGs only feed gifski before being deleted, so spend
+            # as little as possible on deflate (matches the PIL-side
+            # intermediates, which are written at compress_level=1)
+            '-compression_level', '1',
             os.path.join(frames_dir, 'frame_%04d.png')
         ]
-        # Setup to capture output (suppress console)
-        subprocess_kwargs = {
-            'stdout': subprocess.PIPE,
-            'stderr': subprocess.PIPE,
-            'text': True  # capture text output for error parsing
-        }
-        if sys.platform == 'win32':
-            # Hide FFmpeg console window on Windows
-            startupinfo = subprocess.STARTUPINFO()
-            startupinfo.dwFlags |= subprocess.STARTF_USESHOWWINDOW
-            startupinfo.wShowWindow = subprocess.SW_HIDE
-            subprocess_kwargs['startupinfo'] = startupinfo
-            if getattr(sys, 'frozen', False):
-                subprocess_kwargs['creationflags'] = CREATE_NO_WINDOW | SW_HIDE
-            else:
-                subprocess_kwargs['creationflags'] = CREATE_NO_WINDOW
-        else:
-            # On macOS, ensure ffmpeg binary is executable
-            try:
-                os.chmod(FFMPEG_PATH, 0o755)
-            except Exception as e:
-                print(f"Warning: Could not set executable permissions on FFmpeg: {e}")
-        # Run FFmpeg
-        result = subprocess.run(ffmpeg_cmd, **subprocess_kwargs)
-        if result.returncode != 0:
+        subprocess_kwargs = self.get_subprocess_kwargs(FFMPEG_PATH)
+        process = await asyncio.create_subprocess_exec(*ffmpeg_cmd, **subprocess_kwargs)
+        _, stderr = await process.communicate()
+        if process.returncode != 0:
             # If FFmpeg failed, raise an error with its stderr output
-            raise RuntimeError(f"FFmpeg Error: {result.stderr}")
+            raise RuntimeError(f"FFmpeg Error: {stderr.decode() if stderr else 'Unknown error'}")
 
     def extract_gif_frames(self, gif_path, frames_dir):
         """Extract frames from an existing GIF file"""
         try:
-            gif = Image.open(gif_path)
-            frame_count = 0
+            # One pass collects durations and dumps PNGs together; the old
+            # duration loop + second seek() loop re-decoded every frame
+            # from the previous keyframe, making ingest quadratic.
+            # GIF decode is inherently serial, but PNG encode isn't: hand
+            # each frame's raw pixels to a thread pool so encodes overlap
+            # the decode (PIL releases the GIL while compressing)
             durations = []
-
-            try:
-                while True:
-                    durations.append(gif.info['duration'])
-                    gif.seek(gif.tell() + 1)
-            except EOFError:
-                pass  # We've hit the end of the frames
-
-            gif.seek(0)
-
-            try:
-                while True:
-                    frame = gif.convert('RGBA')
-                    frame.save(os.path.join(frames_dir, f'frame_{frame_count:04d}.png'))
-                    frame_count += 1
-                    gif.seek(gif.tell() + 1)
-            except EOFError:
-                pass
-
-            return frame_count, sum(durations) / len(durations) if durations else 100
+            with Image.open(gif_path) as gif, \
+                    concurrent.futures.ThreadPoolExecutor(max_workers=_CPU_COUNT) as pool:
+                futures = []
+                for idx, frame in enumerate(ImageSequence.Iterator(gif)):
+                    durations.append(frame.info.get('duration', 100))
+                    rgba = frame.convert('RGBA')
+                    futures.append(pool.submit(
+                        _save_rgba_png, rgba.tobytes(), rgba.size,
+                        os.path.join(frames_dir, f'frame_{idx:04d}.png')))
+                for future in futures:
+                    future.result()  # propagate encode errors
+
+            return len(durations), sum(durations) / len(durations) if durations else 100
         except Exception as e:
             raise RuntimeError(f"Failed to extract frames from GIF: {str(e)}")
 
+    def probe_media(self, media_path: str) -> dict:
+        """
+        Run ffprobe once on a file and return its stream/format metadata as a
+        dict. Results are cached by (path, mtime, size) so repeated lookups
+        (FPS, dimensions, frame count) cost a single subprocess per file.
+        """
+        try:
+            stat = os.stat(media_path)
+            cache_key = (media_path, stat.st_mtime_ns, stat.st_size)
+        except OSError:
+            cache_key = None
+
+        if cache_key is not None and cache_key in _PROBE_CACHE:
+            return _PROBE_CACHE[cache_key]
+
+        ffprobe_cmd = [
+            FFPROBE_PATH,
+            '-v', 'error',
+            '-select_streams', 'v:0',
+            '-show_streams',
+            '-show_format',
+            '-of', 'json',
+            media_path
+        ]
+        subprocess_kwargs = self.get_subprocess_kwargs(FFPROBE_PATH)
+        subprocess_kwargs['text'] = True
+        result = subprocess.run(ffprobe_cmd, **subprocess_kwargs)
+        if result.returncode != 0:
+            raise RuntimeError(f"ffprobe failed: {result.stderr}")
+
+        info = json.loads(result.stdout)
+        if cache_key is not None:
+            _PROBE_CACHE[cache_key] = info
+        return info
+
     def get_video_fps(self, video_path: str) -> int:
         """
-        Determine the FPS of a video using FFmpeg. Runs FFmpeg with no visible console
-        on Windows and proper permissions on macOS.
+        Determine the FPS of a video from its ffprobe metadata. One JSON
+        probe replaces the old ffmpeg stderr scraping, and the cached result
+        also serves later dimension/frame-count lookups.
         """
-        ffmpeg_cmd = [FFMPEG_PATH, '-i', video_path, '-hide_banner']
-        subprocess_kwargs = {
-            'stderr': subprocess.PIPE,
-            'text': True
-        }
-        if sys.platform == 'win32':
-            startupinfo = subprocess.STARTUPINFO()
-            startupinfo.dwFlags |= subprocess.STARTF_USESHOWWINDOW
-            startupinfo.wShowWindow = subprocess.SW_HIDE
-            subprocess_kwargs['startupinfo'] = startupinfo
-            subprocess_kwargs['creationflags'] = CREATE_NO_WINDOW | SW_HIDE if getattr(sys, 'frozen',
-                                                                                       False) else CREATE_NO_WINDOW
-        else:
-            try:
-                os.chmod(FFMPEG_PATH, 0o755)
-            except Exception as e:
-                print(f"Warning: Could not set executable permissions on FFmpeg: {e}")
-        result = subprocess.run(ffmpeg_cmd, **subprocess_kwargs)
-        output = result.stderr  # FFmpeg prints info (including FPS) to stderr
-        # Parse the output for an "XX fps" pattern or timebase info
-        import re
-        fps_match = re.search(r'(\d+(?:\.\d+)?)\s*fps', output)
-        tb_match = re.search(r'tbr,\s*(\d+(\.\d+)?) tbn', output)  # alternate pattern
-        if fps_match:
-            fps_value = float(fps_match.group(1))
-            self.log(f"Detected FPS: {fps_value}")
-            return round(fps_value)
-        elif tb_match:
-            # If fps not directly given, derive from timebase if present
-            fps_value = float(tb_match.group(1))
-            self.log(f"Calculated FPS from timebase: {fps_value}")
-            return round(fps_value) if 1 <= fps_value <= 120 else 15
-        else:
-            self.log("Could not detect FPS, using default 24")
-            return 24
+        try:
+            streams = self.probe_media(video_path).get('streams', [])
+            if streams:
+                for rate_key in ('avg_frame_rate', 'r_frame_rate'):
+                    rate = streams[0].get(rate_key, '')
+                    if '/' in rate:
+                        num, den = rate.split('/')
+                        if float(den) > 0:
+                            fps_value = float(num) / float(den)
+                            if 1 <= fps_value <= 120:
+                                self.log(f"Detected FPS: {fps_value}")
+                                return round(fps_value)
+        except Exception as e:
+            self.log(f"Could not probe FPS: {e}")
+
+        self.log("Could not detect FPS, using default 24")
+        return 24
 
     def get_subprocess_kwargs(self, binary_path=None):
         """Get platform-specific subprocess configuration"""
@@ -1877,48 +2219,133 @@ class ModernGifConverter(ttk.Frame):
         }
 
         if sys.platform == 'win32':
-            startupinfo = subprocess.STARTUPINFO()
-            startupinfo.dwFlags |= subprocess.STARTF_USESHOWWINDOW
-            startupinfo.wShowWindow = subprocess.SW_HIDE
-            kwargs['startupinfo'] = startupinfo
-            # Use CREATE_NO_WINDOW (and SW_HIDE if frozen) to ensure no visible console
-            if getattr(sys, 'frozen', False):
-                kwargs['creationflags'] = CREATE_NO_WINDOW | SW_HIDE
-            else:
-                kwargs['creationflags'] = CREATE_NO_WINDOW
+            kwargs['startupinfo'] = _WIN_STARTUPINFO
+            kwargs['creationflags'] = _WIN_CREATIONFLAGS
 
         # macOS (or other Unix): ensure the target binary is executable
         else:
-            if binary_path and os.path.exists(binary_path):
-                try:
-                    os.chmod(binary_path, 0o755)
-                except Exception as e:
-                    print(f"Warning: Could not set executable permissions on {binary_path}: {e}")
+            _ensure_binary_ready(binary_path)
         return kwargs
 
-    def has_transparency(self, frames_dir: str) -> bool:
-        """Check if any frame in the sequence has transparency"""
+    def _list_frames(self, frames_dir: str) -> List[str]:
+        """
+        Sorted frame filenames for a directory, cached so the pipeline
+        stages don't rescan the same thousand-entry dir. Pop the entry
+        from _frames_cache after writing or deleting frames.
+        """
+        frames = self._frames_cache.get(frames_dir)
+        if frames is None:
+            # Numeric sort on the frame_NNNN index: zero padding makes the
+            # lexicographic order match until ffmpeg rolls past 9999
+            # frames and the names grow a digit
+            frames = sorted(
+                (entry.name for entry in os.scandir(frames_dir)
+                 if entry.name.startswith('frame_') and entry.name.endswith('.png')),
+                key=lambda name: int(name[6:-4])
+            )
+            self._frames_cache[frames_dir] = frames
+        return frames
+
+    def frame_has_transparency(self, frame_path: str) -> bool:
+        """Check if a single frame image has any transparent pixels"""
         try:
-            frames = sorted([f for f in os.listdir(frames_dir) if f.endswith('.png')])
-            if not frames:
+            # Cheap pre-check on the PNG header: byte 25 of the file is the
+            # IHDR color type, and only types 4 (gray+alpha) and 6 (RGBA)
+            # can carry an alpha channel. For the common opaque case this
+            # answers from 26 bytes instead of decoding megapixels
+            with open(frame_path, 'rb') as f:
+                header = f.read(26)
+            if header[:4] == b'\x89PNG' and len(header) == 26 and header[25] not in (4, 6):
                 return False
 
-            # Check the first frame
-            first_frame_path = os.path.join(frames_dir, frames[0])
-            first_frame = Image.open(first_frame_path)
+            frame = Image.open(frame_path)
 
             # If image is not RGBA, it has no transparency
-            if first_frame.mode != 'RGBA':
+            if frame.mode != 'RGBA':
                 return False
 
-            # Check if the alpha channel has any transparent pixels
-            alpha = first_frame.split()[3]
-            return alpha.getextrema()[0] < 255
+            # One SIMD-vectorized NumPy scan of the alpha channel instead
+            # of PIL's per-pixel extrema walk
+            import numpy as np
+            return int(np.asarray(frame)[..., 3].min()) < 255
 
         except Exception as e:
             self.log(f"Error checking transparency: {str(e)}")
             return False
 
+    def has_transparency(self, frames_dir: str) -> bool:
+        """Check if any frame in the sequence has transparency"""
+        try:
+            frames = self._list_frames(frames_dir)
+            if not frames:
+                return False
+
+            # Check the first frame
+            return self.frame_has_transparency(os.path.join(frames_dir, frames[0]))
+
+        except Exception as e:
+            self.log(f"Error checking transparency: {str(e)}")
+            return False
+
+    async def extract_first_frame(self, video_path: str, frame_path: str):
+        """Extract only the first frame of a video (used to probe for alpha)"""
+        ffmpeg_cmd = [
+            FFMPEG_PATH,
+            '-i', video_path,
+            '-frames:v', '1',
+            '-pix_fmt', 'rgba',
+            frame_path
+        ]
+        kwargs = self.get_subprocess_kwargs(FFMPEG_PATH)
+        process = await asyncio.create_subprocess_exec(*ffmpeg_cmd, **kwargs)
+        await process.communicate()
+
+    def run_piped_video_encode(self, input_path: str, temp_output: str, fps: int,
+                               scaled_width: int, scaled_height: int) -> bool:
+        """
+        Stream decoded frames from ffmpeg straight into gifski over a pipe
+        (yuv4mpegpipe), so no intermediate PNGs are written to disk.
+        Only used for opaque video input. Returns True on success.
+        """
+        ffmpeg_cmd = [
+            FFMPEG_PATH,
+            '-threads', str(_FFMPEG_THREADS),
+            '-i', input_path,
+            '-vf', f'fps={fps}',
+            '-pix_fmt', 'yuv420p',
+            '-f', 'yuv4mpegpipe',
+            '-'
+        ]
+        gifski_cmd = [
+            GIFSKI_PATH,
+            '--output', temp_output,
+            '--quality', '100',
+            '--width', str(scaled_width),
+            '--height', str(scaled_height),
+            '-'
+        ]
+
+        ffmpeg_kwargs = self.get_subprocess_kwargs(FFMPEG_PATH)
+        ffmpeg_kwargs['stderr'] = subprocess.DEVNULL
+        gifski_kwargs = self.get_subprocess_kwargs(GIFSKI_PATH)
+        gifski_kwargs.pop('stdout', None)
+        gifski_kwargs['stderr'] = subprocess.DEVNULL
+
+        ffmpeg_proc = subprocess.Popen(ffmpeg_cmd, **ffmpeg_kwargs)
+        gifski_proc = subprocess.Popen(gifski_cmd, stdin=ffmpeg_proc.stdout, **gifski_kwargs)
+        # Let gifski own the read end so ffmpeg sees EPIPE if it exits
+        ffmpeg_proc.stdout.close()
+
+        while gifski_proc.poll() is None:
+            if self.cancellation_event.is_set():
+                ffmpeg_proc.terminate()
+                gifski_proc.terminate()
+                break
+            time.sleep(0.2)
+
+        ffmpeg_proc.wait()
+        return gifski_proc.wait() == 0 and os.path.exists(temp_output)
+
     async def apply_delta_alpha_optimization(self, frames_dir: str) -> bool:
         """
         Optimizes alpha channel encoding by preserving the base transparency
@@ -1930,70 +2357,58 @@ class ModernGifConverter(ttk.Frame):
         3. Maintaining a running "current alpha state" to track cumulative changes
         """
         try:
-            from PIL import Image
-            import os
             import numpy as np
 
-            frames = sorted([f for f in os.listdir(frames_dir) if f.endswith('.png')])
+            frames = self._list_frames(frames_dir)
             if not frames:
                 self.log("No frames found for alpha optimization")
                 return False
 
-            # Load first frame and use it as reference
-            first_frame_path = os.path.join(frames_dir, frames[0])
-            with Image.open(first_frame_path) as first_frame:
-                if first_frame.mode != 'RGBA':
-                    first_frame = first_frame.convert('RGBA')
-
-                base_alpha = np.array(first_frame.split()[3])
-
+            frame_paths = [os.path.join(frames_dir, f) for f in frames]
             total_frames = len(frames) - 1
             self.log(f"Optimizing alpha channel for {total_frames} frames...")
 
-            # Process frames and track alpha changes
-            prev_alpha = base_alpha.copy()
-            total_changes = 0
-            total_pixels = base_alpha.size
+            # The prev/curr dependency only chains the cheap NumPy diff;
+            # the expensive PNG decode/encode has no cross-frame dependency,
+            # so split the pass into parallel decode, serial diff, parallel
+            # writeback. A thread pool is used rather than processes: PIL
+            # and zlib release the GIL in the decode/encode hot path, and
+            # threads avoid spawn issues in the frozen build
+            with concurrent.futures.ThreadPoolExecutor(max_workers=_CPU_COUNT) as pool:
+                alphas = list(pool.map(_load_frame_alpha, frame_paths))
 
-            # Process frames
-            for i in range(1, len(frames)):
                 if self.cancellation_event.is_set():
                     return False
 
-                frame_path = os.path.join(frames_dir, frames[i])
-                with Image.open(frame_path) as frame:
-                    if frame.mode != 'RGBA':
-                        frame = frame.convert('RGBA')
-
-                    # Get the current frame's channels
-                    r, g, b, curr_alpha = frame.split()
-                    curr_alpha_array = np.array(curr_alpha)
-
-                    # Detect actual changes in alpha
-                    alpha_diff = curr_alpha_array != prev_alpha
-                    change_count = np.sum(alpha_diff)
+                # Serial sweep: each frame's merged alpha depends on the
+                # previous frame's result. The diff mask reuses one
+                # preallocated buffer, and no merge buffer is needed at
+                # all: wherever the mask is False the two channels already
+                # agree, so the merged alpha is exactly the current
+                # frame's channel
+                prev_alpha = alphas[0]
+                total_changes = 0
+                total_pixels = prev_alpha.size
+                diff = np.empty(prev_alpha.shape, dtype=np.bool_)
+                write_tasks = []
+                for i in range(1, len(frames)):
+                    np.not_equal(alphas[i], prev_alpha, out=diff)
+                    change_count = int(np.count_nonzero(diff))
                     total_changes += change_count
 
-                    if np.any(alpha_diff):
-                        # Only update alpha values that have actually changed
-                        new_alpha = prev_alpha.copy()
-                        new_alpha[alpha_diff] = curr_alpha_array[alpha_diff]
-
-                        # Create new frame with updated alpha
-                        new_alpha_img = Image.fromarray(new_alpha, mode='L')
-                        new_frame = Image.merge('RGBA', (r, g, b, new_alpha_img))
-
-                        # Save the modified frame, overwriting the original
-                        new_frame.save(frame_path, 'PNG')
+                    if change_count:
+                        write_tasks.append((frame_paths[i], alphas[i]))
+                    prev_alpha = alphas[i]
 
-                        # Update previous alpha for next comparison
-                        prev_alpha = new_alpha
+                if self.cancellation_event.is_set():
+                    return False
 
-                    # Log progress periodically
-                    if i % 10 == 0 or i == total_frames:
-                        avg_changes = (total_changes / (i * total_pixels)) * 100
-                        self.log(f"Processed {i}/{total_frames} frames - Avg alpha changes: {avg_changes:.1f}%",
-                                 replace_last=True)
+                # Re-encode only the frames whose alpha actually changed
+                if write_tasks:
+                    self.log(f"Rewriting {len(write_tasks)}/{total_frames} frames with merged alpha...",
+                             replace_last=True)
+                    for _ in pool.map(lambda task: _write_frame_alpha(*task), write_tasks):
+                        pass
 
             # Final statistics
             avg_changes_overall = (total_changes / (total_frames * total_pixels)) * 100
@@ -2028,48 +2443,24 @@ class ModernGifConverter(ttk.Frame):
                 self.log("Applying delta-based alpha optimization...")
                 return await self.apply_delta_alpha_optimization(frames_dir)
 
-            # Original uniform transparency behavior
-            # Load the alpha mask from the first frame
-            first_frame = Image.open(first_frame_path)
-            if first_frame.mode != 'RGBA':
-                first_frame = first_frame.convert('RGBA')
+            # Original uniform transparency behavior: stamp the first
+            # frame's alpha channel onto every other frame. Each frame is
+            # an independent decode/stamp/encode with no cross-frame
+            # dependency, so it runs through the same NumPy helpers and
+            # thread pool as the delta pass instead of PIL's serial
+            # split/merge per frame
+            alpha_mask = _load_frame_alpha(first_frame_path)
 
-            # Extract the alpha channel to use as a uniform mask
-            alpha_mask = first_frame.split()[3]
+            frames = self._list_frames(frames_dir)
+            remaining_frames = [os.path.join(frames_dir, f) for f in frames[1:]]
 
-            # Get all PNG frames in the directory
-            frames = sorted([f for f in os.listdir(frames_dir) if f.endswith('.png')])
-            remaining_frames = len(frames) - 1  # Subtract 1 since we already processed first frame
+            self.log(f"Applying uniform transparency mask to {len(remaining_frames)} frames...")
 
-            self.log(f"Applying uniform transparency mask to {remaining_frames} frames...")
-
-            # Process each remaining frame
-            progress_update_interval = max(1, remaining_frames // 20)  # Update ~20 times total
-            for idx, frame_file in enumerate(frames[1:], 1):
-                # Check for user cancellation
-                if self.cancellation_event.is_set():
-                    return False
-
-                # Only update progress display occasionally to reduce jittering
-                if idx % progress_update_interval == 0 or idx == remaining_frames:
-                    self.log(f"Processing frames: {idx}/{remaining_frames}", replace_last=True)
-
-                # Load and process the current frame
-                frame_path = os.path.join(frames_dir, frame_file)
-                frame = Image.open(frame_path)
-
-                # Ensure frame is in RGBA mode
-                if frame.mode != 'RGBA':
-                    frame = frame.convert('RGBA')
-
-                # Split the frame into its color channels
-                r, g, b, _ = frame.split()
-
-                # Create new frame with original RGB but uniform alpha mask
-                new_frame = Image.merge('RGBA', (r, g, b, alpha_mask))
-
-                # Save the modified frame, overwriting the original
-                new_frame.save(frame_path, 'PNG')
+            with concurrent.futures.ThreadPoolExecutor(max_workers=_CPU_COUNT) as pool:
+                for _ in pool.map(lambda path: _write_frame_alpha(path, alpha_mask),
+                                  remaining_frames):
+                    if self.cancellation_event.is_set():
+                        return False
 
             self.log("✓ Transparency processing complete")
             return True
@@ -2095,7 +2486,7 @@ class ModernGifConverter(ttk.Frame):
                 shutil.rmtree(skip_dir)
             os.makedirs(skip_dir)
 
-            frames = sorted([f for f in os.listdir(source_dir) if f.endswith('.png')])
+            frames = self._list_frames(source_dir)
             if not frames:
                 self.log(f"No frames found in source directory: {source_dir}")
                 return source_dir
@@ -2110,7 +2501,15 @@ class ModernGifConverter(ttk.Frame):
                     dest_path = os.path.normpath(os.path.join(skip_dir, new_frame_name))
 
                     try:
-                        shutil.copy2(source_path, dest_path)
+                        # Hardlink instead of copying: the frames are
+                        # read-only inputs to gifski, so a link gives the
+                        # sequential naming without moving any pixel data.
+                        # Fall back to a real copy if linking isn't
+                        # possible (cross-device, FAT, permissions)
+                        try:
+                            os.link(source_path, dest_path)
+                        except OSError:
+                            shutil.copy2(source_path, dest_path)
                         new_frame_index += 1
                         processed_frames += 1
                     except Exception as e:
@@ -2131,6 +2530,55 @@ class ModernGifConverter(ttk.Frame):
                 shutil.rmtree(skip_dir)
             return source_dir
 
+    def prescale_frames(self, frames_dir: str, scale_percent: int) -> str:
+        """
+        Resize every extracted frame once, up front, into a sibling directory.
+
+        gifski's --width/--height re-decode and rescale each source PNG, and
+        the size search runs gifski once per attempt — nine attempts means
+        nine resizes of every frame. The scale setting is fixed for the whole
+        conversion, so one pre-scaled set serves every attempt. Returns the
+        directory the attempts should read from (the original when no scaling
+        is requested).
+        """
+        if scale_percent >= 100:
+            return frames_dir
+
+        frames = self._list_frames(frames_dir)
+        if not frames:
+            return frames_dir
+
+        scaled_dir = os.path.join(os.path.dirname(frames_dir), 'frames_scaled')
+        os.makedirs(scaled_dir, exist_ok=True)
+        self._frames_cache.pop(scaled_dir, None)
+
+        with Image.open(os.path.join(frames_dir, frames[0])) as first_frame:
+            width, height = first_frame.size
+        scaled_size = (max(int(width * scale_percent / 100), 1),
+                       max(int(height * scale_percent / 100), 1))
+
+        # Exact-divisor scales (50% and 25%) hit Pillow's specialized
+        # integer box filter, which is several times faster than a general
+        # resize and visually equivalent for plain downscales
+        ratio = 100 / scale_percent
+        reduce_factor = int(ratio) if ratio.is_integer() and int(ratio) in (2, 3, 4) else None
+
+        def scale_one(name):
+            with Image.open(os.path.join(frames_dir, name)) as img:
+                if reduce_factor:
+                    scaled = img.reduce(reduce_factor)
+                else:
+                    scaled = img.resize(scaled_size, Image.Resampling.LANCZOS)
+                scaled.save(os.path.join(scaled_dir, name), 'PNG', compress_level=1)
+
+        # PIL releases the GIL during resize and PNG encode, so threads
+        # scale this across cores; the resize runs once, so the better
+        # LANCZOS kernel is affordable here
+        with concurrent.futures.ThreadPoolExecutor(max_workers=_CPU_COUNT) as pool:
+            list(pool.map(scale_one, frames))
+
+        return scaled_dir
+
     # This is an update to try_optimization_params to fix the timeout issue and simplify progress indicators
     async def try_optimization_params(self, frames_dir: str, params: OptimizationParams,
                                       current_fps: float, batch_id: int, attempt_id: int) -> Tuple[int, str, str]:
@@ -2148,8 +2596,17 @@ class ModernGifConverter(ttk.Frame):
         quality = 100 if settings.get('lock_quality', False) else params.quality
         lossy = 0 if settings.get('lock_lossy', False) else params.lossy
         frame_skip = 1 if settings.get('lock_frame_skip', False) else params.frame_skip
-        scale_percent = settings.get('scale', 100)
-        params = OptimizationParams(quality=quality, lossy=lossy, frame_skip=frame_skip, output_path=params.output_path)
+        params = OptimizationParams(quality=quality, lossy=lossy, frame_skip=frame_skip,
+                                    output_path=params.output_path, frame_files=params.frame_files)
+
+        # Attempts in a batch are launched concurrently; the semaphore
+        # bounds how many gifski/gifsicle pairs are actually alive at once
+        # (they are multithreaded themselves, so a full 18-attempt batch
+        # would oversubscribe the machine). Created lazily so it binds to
+        # the background loop
+        if self._attempt_semaphore is None:
+            self._attempt_semaphore = asyncio.Semaphore(_MAX_PARALLEL_JOBS)
+        await self._attempt_semaphore.acquire()
 
         try:
             if self.cancellation_event.is_set():
@@ -2164,81 +2621,51 @@ class ModernGifConverter(ttk.Frame):
             # Brief status update without replacing previous logs
             self.log(f"Starting attempt {attempt_id}: q={quality}, l={lossy}, skip={frame_skip}")
 
-            # Prepare skipped frames directory
-            skip_dir = await self.prepare_frames_with_skip(frames_dir, frame_skip, batch_id, attempt_id)
+            # Frame skip needs no skip directory: gifski is given an
+            # explicit ordered file list (--no-sort below), so slicing the
+            # source listing selects every Nth frame with zero filesystem
+            # work. prepare_frames_with_skip remains for encoders that
+            # require sequential frame names.
+            skip_dir = frames_dir
+
+            # The caller hands over the joined frame paths, computed once
+            # for the whole conversion; fall back to the cached listing
+            # for callers that don't
+            frame_files = list(params.frame_files) or \
+                [os.path.join(frames_dir, f) for f in self._list_frames(frames_dir)]
+            if frame_skip > 1:
+                frame_files = frame_files[::frame_skip]
+            if not frame_files:
+                raise RuntimeError(f"No frames found in frames directory: {frames_dir}")
             if self.cancellation_event.is_set():
                 return float('inf'), "", skip_dir
-            if not skip_dir or not os.path.isdir(skip_dir):
-                raise RuntimeError(f"Skip directory not created or missing: {skip_dir}")
-            frames = sorted([f for f in os.listdir(skip_dir) if f.endswith('.png')])
-            if not frames:
-                raise RuntimeError(f"No frames found in skip directory: {skip_dir}")
 
             effective_fps = current_fps / frame_skip if frame_skip > 1 else current_fps
 
-            # Determine scaling dimensions from the first frame
-            first_frame_path = os.path.join(skip_dir, frames[0])
-            from PIL import Image
-            with Image.open(first_frame_path) as img:
-                width, height = img.size
-            scaled_width = max(int(width * scale_percent / 100), 1)
-            scaled_height = max(int(height * scale_percent / 100), 1)
-
-            # Get list of all frame files in order rather than using wildcards
-            frame_files = sorted(glob.glob(os.path.join(skip_dir, 'frame_*.png')))
-
             # Setup platform-specific subprocess kwargs
             subprocess_kwargs = {'stdout': subprocess.PIPE, 'stderr': subprocess.PIPE}
             if sys.platform == 'win32':
-                startupinfo = subprocess.STARTUPINFO()
-                startupinfo.dwFlags |= subprocess.STARTF_USESHOWWINDOW
-                startupinfo.wShowWindow = subprocess.SW_HIDE
-                subprocess_kwargs['startupinfo'] = startupinfo
-                # Use CREATE_NO_WINDOW (and SW_HIDE if frozen) to ensure no visible console
-                if getattr(sys, 'frozen', False):
-                    subprocess_kwargs['creationflags'] = CREATE_NO_WINDOW | SW_HIDE
-                else:
-                    subprocess_kwargs['creationflags'] = CREATE_NO_WINDOW
+                subprocess_kwargs['startupinfo'] = _WIN_STARTUPINFO
+                subprocess_kwargs['creationflags'] = _WIN_CREATIONFLAGS
 
-            # Build and run gifski command with explicit frame files instead of frame pattern
+            # Build and run gifski command with explicit frame files instead
+            # of a frame pattern. No --width/--height: frames arrive already
+            # scaled (prescale_frames), so gifski encodes them as-is
             gifski_cmd = [
                 GIFSKI_PATH,
                 '--output', temp_output,
                 '--quality', str(quality),
                 '--fps', str(effective_fps),
-                '--width', str(scaled_width),
-                '--height', str(scaled_height),
                 '--no-sort',
             ]
             # Add each frame file as a separate argument
             gifski_cmd.extend(frame_files)
 
-            # Start gifski with longer timeout - frame count dependent
-            frame_count = len(frame_files)
-            # Calculate timeout based on frame count - more frames need more time
-            timeout = max(60, min(300, frame_count * 0.5))  # Between 60s and 300s based on frame count
-
             gifski_proc = await asyncio.create_subprocess_exec(*gifski_cmd, **subprocess_kwargs)
 
-            # Wait for completion with cancellation checks
-            while True:
-                if self.cancellation_event.is_set():
-                    gifski_proc.terminate()
-                    await gifski_proc.wait()
-                    return float('inf'), "", skip_dir
-
-                # Check if process is done
-                try:
-                    await asyncio.wait_for(asyncio.shield(gifski_proc.wait()), timeout=0.5)
-                    break  # Process completed
-                except asyncio.TimeoutError:
-                    # Still running, continue waiting
-                    await asyncio.sleep(0.1)
-
-                # Check if exceeding total timeout
-                if gifski_proc.returncode is None:
-                    # Process still running, continue
-                    pass
+            # Await completion, racing cancellation instead of polling
+            if not await self._wait_for_process(gifski_proc):
+                return float('inf'), "", skip_dir
 
             if not os.path.exists(temp_output):
                 raise RuntimeError("GIF generation via gifski failed")
@@ -2254,15 +2681,22 @@ class ModernGifConverter(ttk.Frame):
             elif play_count > 1:
                 loop_param = f'--loop={play_count - 1}'
 
+            # Search attempts optimize at -O2: most of them are discarded,
+            # and -O3's exhaustive transformation search costs 2-3x the
+            # time for a few percent of size. The winning result gets a
+            # full -O3 pass during finalization
             gifsicle_cmd = [
                 GIFSICLE_PATH,
-                f'--lossy={lossy}',
-                '-O3',
-                '--careful',
+                *_gifsicle_lossy_args(lossy),
+                '-O2',
                 '--no-warnings',
                 '--no-ignore-errors',
                 '--resize-method=sample'
             ]
+            # --careful emits conservative frames for buggy old viewers at a
+            # real size/speed cost; off unless the user opts in
+            if settings.get('careful_compat', False):
+                gifsicle_cmd.append('--careful')
             if loop_param:
                 gifsicle_cmd.append(loop_param)
             if settings.get('preserve_animated_alpha', False):
@@ -2271,37 +2705,73 @@ class ModernGifConverter(ttk.Frame):
 
             gifsicle_proc = await asyncio.create_subprocess_exec(*gifsicle_cmd, **subprocess_kwargs)
 
-            # Wait for completion with cancellation checks
-            while True:
-                if self.cancellation_event.is_set():
-                    gifsicle_proc.terminate()
-                    await gifsicle_proc.wait()
-                    return float('inf'), "", skip_dir
-
-                # Check if process is done
-                try:
-                    await asyncio.wait_for(asyncio.shield(gifsicle_proc.wait()), timeout=0.5)
-                    break  # Process completed
-                except asyncio.TimeoutError:
-                    # Still running, continue waiting
-                    await asyncio.sleep(0.1)
+            # Await completion, racing cancellation instead of polling
+            if not await self._wait_for_process(gifsicle_proc):
+                return float('inf'), "", skip_dir
 
-            if not os.path.exists(temp_output_optimized):
+            # One stat covers both the existence check and the size
+            try:
+                size = os.stat(temp_output_optimized).st_size
+            except OSError:
                 raise RuntimeError("GIF optimization via gifsicle failed")
 
-            size = os.path.getsize(temp_output_optimized)
             self.log(f"✓ Attempt {attempt_id} complete: {size / 1024:.1f} KB")
             return size, temp_output_optimized, skip_dir
         except Exception as e:
             self.log(f"✗ Attempt {attempt_id} failed: {str(e)}")
             return float('inf'), "", skip_dir
         finally:
-            if temp_output and os.path.exists(temp_output):
+            self._attempt_semaphore.release()
+            if temp_output:
                 try:
                     os.remove(temp_output)
-                except Exception as e:
+                except FileNotFoundError:
+                    pass
+                except OSError as e:
                     self.log(f"Error removing temporary file: {e}")
 
+    def _cleanup_temp_paths(self, temp_paths, temp_parent_dir):
+        """
+        Dispose of a conversion's temporary tree without blocking completion.
+
+        The parent directory is renamed out of the way — atomic and instant —
+        and then unlinked on the worker pool, so the UI flips back to its done
+        state immediately and a follow-up conversion (batch mode reuses the
+        same gif_conversion_temp path next to the input) can recreate the
+        directory while the old tree is still being deleted.
+        """
+        doomed = []
+        for path in temp_paths:
+            # Anything inside the parent goes with it in one rmtree
+            if temp_parent_dir and path.startswith(temp_parent_dir):
+                continue
+            doomed.append(path)
+
+        if temp_parent_dir and os.path.isdir(temp_parent_dir):
+            trash_dir = f"{temp_parent_dir}_trash_{os.getpid()}_{time.monotonic_ns()}"
+            try:
+                os.rename(temp_parent_dir, trash_dir)
+                doomed.append(trash_dir)
+            except OSError:
+                doomed.append(temp_parent_dir)
+
+        if not doomed:
+            return
+
+        def remove_all():
+            for path in doomed:
+                try:
+                    if os.path.isdir(path):
+                        shutil.rmtree(path)
+                    else:
+                        os.remove(path)
+                except FileNotFoundError:
+                    pass
+                except Exception as e:
+                    self.log(f"Error cleaning up {path}: {e}")
+
+        self.executor.submit(remove_all)
+
     async def convert_to_gif(self, input_path: str, desired_size: Optional[int]):
         """Main conversion method"""
         frames_dir = None
@@ -2313,20 +2783,41 @@ class ModernGifConverter(ttk.Frame):
         attempt_counter = 0
         found_acceptable_result = False
 
+        # Park the pulsing border for the duration of the conversion: each
+        # tick is a Tk wakeup every 16 ms competing with log draining, and
+        # attention is on the log anyway
+        pulse_was_active = self.pulse_animation_active
+        if pulse_was_active:
+            self.stop_pulse_animation()
+
         try:
             output_path = os.path.splitext(input_path)[0] + '_optimized.gif'
             target_size_bytes = desired_size * 1024 if desired_size else None
 
-            # Create a parent directory for all temporary files
-            parent_dir = os.path.dirname(input_path)
-            temp_parent_dir = os.path.join(parent_dir, 'gif_conversion_temp')
-            if os.path.exists(temp_parent_dir):
-                shutil.rmtree(temp_parent_dir)
-            os.makedirs(temp_parent_dir)
+            # Settings are constant for the duration of one conversion;
+            # load them once instead of per stage
+            settings = OptionsWindow.load_settings()
+
+            # Create a parent directory for all temporary files. On Linux,
+            # prefer tmpfs (/dev/shm) so intermediate frames live in RAM and
+            # never hit the disk; elsewhere keep it next to the input file.
+            if sys.platform.startswith('linux') and os.path.isdir('/dev/shm'):
+                temp_parent_dir = tempfile.mkdtemp(prefix='gif_conversion_', dir='/dev/shm')
+            else:
+                parent_dir = os.path.dirname(input_path)
+                temp_parent_dir = os.path.join(parent_dir, 'gif_conversion_temp')
+                try:
+                    shutil.rmtree(temp_parent_dir)
+                except FileNotFoundError:
+                    pass
+                os.makedirs(temp_parent_dir)
 
             # Create frames directory inside temp parent directory
             frames_dir = os.path.join(temp_parent_dir, 'frames_temp')
             os.makedirs(frames_dir)
+            # Fresh frames dir: drop any cached listing from a previous
+            # conversion that reused the same path
+            self._frames_cache.pop(frames_dir, None)
 
             self.log("Starting conversion process...")
 
@@ -2337,6 +2828,8 @@ class ModernGifConverter(ttk.Frame):
 
             # Initial frame extraction
             is_gif = input_path.lower().endswith('.gif')
+            use_piped_encode = False
+            probe_frame_path = os.path.join(temp_parent_dir, 'probe_frame.png')
 
             if is_gif:
                 self.log("Extracting frames from GIF...")
@@ -2347,35 +2840,49 @@ class ModernGifConverter(ttk.Frame):
                 self.log(f"✓ Extracted {frame_count} frames at {current_fps} FPS")
             else:
                 current_fps = await self.run_in_executor(self.get_video_fps, input_path)
-                self.log("Extracting frames from video...")
-                await self.run_in_executor(
-                    self.extract_frames, input_path, frames_dir, current_fps
-                )
-                frames = sorted([f for f in os.listdir(frames_dir) if f.endswith('.png')])
-                self.log(f"✓ Extracted {len(frames)} frames at {current_fps} FPS")
+
+                if desired_size is None:
+                    # Probe the first frame: if the video is opaque we can
+                    # stream ffmpeg straight into gifski without writing
+                    # intermediate PNGs (only worthwhile for the single
+                    # max-quality pass; the size search reuses frames on disk)
+                    await self.extract_first_frame(input_path, probe_frame_path)
+                    if os.path.exists(probe_frame_path):
+                        use_piped_encode = not await self.run_in_executor(
+                            self.frame_has_transparency, probe_frame_path
+                        )
+
+                if use_piped_encode:
+                    self.log("Opaque video detected, streaming frames directly to encoder...")
+                else:
+                    self.log("Extracting frames from video...")
+                    await self.extract_frames(input_path, frames_dir, current_fps)
+                    frames = self._list_frames(frames_dir)
+                    self.log(f"✓ Extracted {len(frames)} frames at {current_fps} FPS")
 
             # Check for cancellation after frame extraction
             if self.cancellation_event.is_set():
                 self.log("\nConversion cancelled by user")
                 return
 
-            # Verify frames were extracted
-            frames = sorted([f for f in os.listdir(frames_dir) if f.endswith('.png')])
-            if not frames:
-                raise RuntimeError("No frames were extracted from the input file")
-
-            # Check for transparency
-            has_transparency = await self.run_in_executor(self.has_transparency, frames_dir)
-
-            if has_transparency:
-                self.log("Detected transparency in frames, processing alpha channel...")
-                # Apply transparency mask
-                first_frame_path = os.path.join(frames_dir, frames[0])
-                success = await self.apply_transparency_mask(frames_dir, first_frame_path)
-                if not success:
-                    raise RuntimeError("Failed to apply transparency mask")
-            else:
-                self.log("No transparency detected, skipping alpha channel processing...")
+            if not use_piped_encode:
+                # Verify frames were extracted
+                frames = self._list_frames(frames_dir)
+                if not frames:
+                    raise RuntimeError("No frames were extracted from the input file")
+
+                # Check for transparency
+                has_transparency = await self.run_in_executor(self.has_transparency, frames_dir)
+
+                if has_transparency:
+                    self.log("Detected transparency in frames, processing alpha channel...")
+                    # Apply transparency mask
+                    first_frame_path = os.path.join(frames_dir, frames[0])
+                    success = await self.apply_transparency_mask(frames_dir, first_frame_path)
+                    if not success:
+                        raise RuntimeError("Failed to apply transparency mask")
+                else:
+                    self.log("No transparency detected, skipping alpha channel processing...")
 
             if desired_size is None:
                 # Use maximum quality settings
@@ -2389,8 +2896,8 @@ class ModernGifConverter(ttk.Frame):
                 temp_output = os.path.join(temp_parent_dir, 'max_quality.gif')
                 temp_output_optimized = os.path.join(temp_parent_dir, 'max_quality_optimized.gif')
 
-                # Get list of all frame files in order rather than using wildcards
-                frame_files = sorted(glob.glob(os.path.join(frames_dir, 'frame_*.png')))
+                # Frame listing comes from the per-directory cache
+                frame_files = [os.path.join(frames_dir, f) for f in self._list_frames(frames_dir)]
 
                 # Set up subprocess configurations
                 subprocess_kwargs = {
@@ -2399,69 +2906,57 @@ class ModernGifConverter(ttk.Frame):
                 }
 
                 if sys.platform == 'win32':
-                    startupinfo = subprocess.STARTUPINFO()
-                    startupinfo.dwFlags |= subprocess.STARTF_USESHOWWINDOW
-                    startupinfo.wShowWindow = subprocess.SW_HIDE
-                    subprocess_kwargs['startupinfo'] = startupinfo
-
-                    if getattr(sys, 'frozen', False):
-                        subprocess_kwargs['creationflags'] = CREATE_NO_WINDOW | SW_HIDE
-                    else:
-                        subprocess_kwargs['creationflags'] = CREATE_NO_WINDOW
+                    subprocess_kwargs['startupinfo'] = _WIN_STARTUPINFO
+                    subprocess_kwargs['creationflags'] = _WIN_CREATIONFLAGS
                 else:
                     # Ensure executable permissions on macOS for GIFSKI
-                    try:
-                        os.chmod(GIFSKI_PATH, 0o755)
-                    except Exception as e:
-                        self.log(f"Warning: Could not set executable permissions on gifski: {str(e)}")
+                    _ensure_binary_ready(GIFSKI_PATH)
 
                 # Get frame dimensions and apply scaling
                 width = height = 0
-                with Image.open(os.path.join(frames_dir, frames[0])) as first_frame:
+                dims_source = probe_frame_path if use_piped_encode else os.path.join(frames_dir, frames[0])
+                with Image.open(dims_source) as first_frame:
                     width, height = first_frame.size
 
                 # Get scale setting
-                settings = OptionsWindow.load_settings()
                 scale_percent = settings.get('scale', 100)
 
                 # Calculate scaled dimensions
                 scaled_width = max(int(width * scale_percent / 100), 1)
                 scaled_height = max(int(height * scale_percent / 100), 1)
 
-                # Build gifski command with explicit frame files instead of pattern
-                gifski_cmd = [
-                    GIFSKI_PATH,
-                    '--output', temp_output,
-                    '--quality', '100',
-                    '--fps', str(current_fps),
-                    '--width', str(scaled_width),
-                    '--height', str(scaled_height),
-                    '--no-sort',
-                ]
-                # Add each frame file explicitly
-                gifski_cmd.extend(frame_files)
-
-                gifski_proc = await asyncio.create_subprocess_exec(
-                    *gifski_cmd,
-                    **subprocess_kwargs
-                )
-
-                try:
-                    await asyncio.wait_for(gifski_proc.wait(), timeout=0.5)
-                    while gifski_proc.returncode is None:
-                        if self.cancellation_event.is_set():
-                            gifski_proc.terminate()
-                            await gifski_proc.wait()
-                            self.log("\nConversion cancelled by user")
-                            return
-                        await asyncio.sleep(0.1)
-                except asyncio.TimeoutError:
+                if use_piped_encode:
+                    success = await self.run_in_executor(
+                        self.run_piped_video_encode, input_path, temp_output,
+                        current_fps, scaled_width, scaled_height
+                    )
                     if self.cancellation_event.is_set():
-                        gifski_proc.terminate()
-                        await gifski_proc.wait()
                         self.log("\nConversion cancelled by user")
                         return
-                    await gifski_proc.wait()
+                    if not success:
+                        raise RuntimeError("Piped encode failed to produce output")
+                else:
+                    # Build gifski command with explicit frame files instead of pattern
+                    gifski_cmd = [
+                        GIFSKI_PATH,
+                        '--output', temp_output,
+                        '--quality', '100',
+                        '--fps', str(current_fps),
+                        '--width', str(scaled_width),
+                        '--height', str(scaled_height),
+                        '--no-sort',
+                    ]
+                    # Add each frame file explicitly
+                    gifski_cmd.extend(frame_files)
+
+                    gifski_proc = await asyncio.create_subprocess_exec(
+                        *gifski_cmd,
+                        **subprocess_kwargs
+                    )
+
+                    if not await self._wait_for_process(gifski_proc):
+                        self.log("\nConversion cancelled by user")
+                        return
 
                 # Check for cancellation before optimization
                 if self.cancellation_event.is_set():
@@ -2470,13 +2965,9 @@ class ModernGifConverter(ttk.Frame):
 
                 # Before running gifsicle, ensure executable permissions on macOS for GIFSICLE
                 if sys.platform != 'win32':
-                    try:
-                        os.chmod(GIFSICLE_PATH, 0o755)
-                    except Exception as e:
-                        self.log(f"Warning: Could not set executable permissions on gifsicle: {str(e)}")
+                    _ensure_binary_ready(GIFSICLE_PATH)
 
                 # Run gifsicle with cancellation check
-                settings = OptionsWindow.load_settings()
                 play_count = settings.get('loop_count', 0)
 
                 if play_count == 0:
@@ -2488,7 +2979,7 @@ class ModernGifConverter(ttk.Frame):
                 gifsicle_process = await asyncio.create_subprocess_exec(
                     GIFSICLE_PATH,
                     '-O3',
-                    '--careful',
+                    *(['--careful'] if settings.get('careful_compat', False) else []),
                     '--no-warnings',
                     '--no-ignore-errors',
                     '--resize-method=sample',
@@ -2498,22 +2989,9 @@ class ModernGifConverter(ttk.Frame):
                     **subprocess_kwargs
                 )
 
-                try:
-                    await asyncio.wait_for(gifsicle_process.wait(), timeout=0.5)
-                    while gifsicle_process.returncode is None:
-                        if self.cancellation_event.is_set():
-                            gifsicle_process.terminate()
-                            await gifsicle_process.wait()
-                            self.log("\nConversion cancelled by user")
-                            return
-                        await asyncio.sleep(0.1)
-                except asyncio.TimeoutError:
-                    if self.cancellation_event.is_set():
-                        gifsicle_process.terminate()
-                        await gifsicle_process.wait()
-                        self.log("\nConversion cancelled by user")
-                        return
-                    await gifsicle_process.wait()
+                if not await self._wait_for_process(gifsicle_process):
+                    self.log("\nConversion cancelled by user")
+                    return
 
                 # Save the result
                 if os.path.exists(temp_output_optimized):
@@ -2521,7 +2999,6 @@ class ModernGifConverter(ttk.Frame):
                         self.log("\nFinalizing...")
 
                         # Check if ImageMagick optimization is enabled
-                        settings = OptionsWindow.load_settings()
                         use_imagemagick = settings.get('use_imagemagick', True)
 
                         if use_imagemagick:
@@ -2529,19 +3006,25 @@ class ModernGifConverter(ttk.Frame):
                             final_path = await self.apply_imagemagick_optimization(temp_output_optimized,
                                                                                    output_path)
                         else:
-                            # Copy the file directly to the output path
-                            shutil.copy2(temp_output_optimized, output_path)
+                            # Rename instead of copying the whole GIF; the
+                            # temp tree may sit on another filesystem
+                            # (tmpfs), where a move is still needed
+                            try:
+                                os.replace(temp_output_optimized, output_path)
+                            except OSError:
+                                shutil.move(temp_output_optimized, output_path)
                             final_path = output_path
 
-                        if os.path.exists(final_path):
-                            final_size = os.path.getsize(final_path)
-                            message = f"GIF saved successfully!\nSize: {final_size / 1024:.1f}KB"
-                            self.log(f"✓ Conversion complete: {final_size / 1024:.1f}KB")
-                            if not hasattr(self, 'suppress_dialogs') or not self.suppress_dialogs:
-                                messagebox.showinfo("Success", message)
-                        else:
+                        try:
+                            final_size = os.stat(final_path).st_size
+                        except OSError:
                             raise RuntimeError("Failed to save final GIF")
 
+                        message = f"GIF saved successfully!\nSize: {final_size / 1024:.1f}KB"
+                        self.log(f"✓ Conversion complete: {final_size / 1024:.1f}KB")
+                        if not hasattr(self, 'suppress_dialogs') or not self.suppress_dialogs:
+                            messagebox.showinfo("Success", message)
+
                     except Exception as e:
                         self.log(f"Error during final optimization: {str(e)}")
                         raise RuntimeError("Failed to create final GIF")
@@ -2549,6 +3032,15 @@ class ModernGifConverter(ttk.Frame):
                     raise RuntimeError("Failed to create initial GIF")
 
             else:
+                # Scale once up front; every attempt then encodes the same
+                # pre-scaled frames instead of re-resizing through gifski
+                scale_percent = settings.get('scale', 100)
+                if scale_percent < 100:
+                    self.log("Pre-scaling frames...")
+                    frames_dir = await self.run_in_executor(
+                        self.prescale_frames, frames_dir, scale_percent
+                    )
+
                 # Define optimization batches
                 batch_params = [
                     # Batch 1: High quality, minimal frame skip
@@ -2574,6 +3066,19 @@ class ModernGifConverter(ttk.Frame):
                 self.log("\nStarting optimization process...")
                 all_batch_results_under_target = False
 
+                # Every attempt encodes from the same source frames; join
+                # the paths once here instead of once per attempt
+                all_frame_files = tuple(
+                    os.path.join(frames_dir, f) for f in self._list_frames(frames_dir)
+                )
+
+                # The batches overlap (and batch 3 repeats a quality on
+                # purpose-less duplication); identical parameter triples
+                # would rerun the whole gifski+gifsicle pipeline for a
+                # result we already have, so track what has been tried.
+                # frame_skip 0 and 1 both mean "keep every frame"
+                attempted_params = set()
+
                 for batch_idx, batch in enumerate(batch_params, 1):
                     if self.cancellation_event.is_set():
                         self.log("\nConversion cancelled by user")
@@ -2591,25 +3096,64 @@ class ModernGifConverter(ttk.Frame):
                                 if self.cancellation_event.is_set():
                                     break
 
+                                key = (quality, lossy, max(1, frame_skip))
+                                if key in attempted_params:
+                                    continue
+                                attempted_params.add(key)
+
                                 params = OptimizationParams(
                                     quality=quality,
                                     lossy=lossy,
                                     frame_skip=frame_skip,
-                                    output_path=os.path.join(batch_dir, f'attempt_{attempt_counter}')
+                                    output_path=os.path.join(batch_dir, f'attempt_{attempt_counter}'),
+                                    frame_files=all_frame_files
                                 )
-                                task = self.try_optimization_params(
+                                attempt = self.try_optimization_params(
                                     frames_dir, params, current_fps, batch_idx, attempt_counter
                                 )
-                                tasks.append(task)
+                                tasks.append((_attempt_size_estimate(quality, lossy, frame_skip),
+                                              attempt))
                                 attempt_counter += 1
 
                     if self.cancellation_event.is_set():
                         break
 
+                    # Start the smallest-estimate attempts first: they are
+                    # also the fastest (fewest frames, cheapest settings),
+                    # so the dominance pruning below gets its first result
+                    # — and its first chance to cancel the expensive
+                    # high-quality attempts — as early as possible
+                    tasks.sort(key=lambda item: item[0])
+
+                    # Each attempt reports its own size estimate back so the
+                    # dispatcher can prune by dominance (see below)
+                    async def tag_attempt(est, attempt):
+                        return est, await attempt
+
                     # Use asyncio.as_completed to handle results as they come in
-                    pending = [asyncio.create_task(t) for t in tasks]
+                    est_of = {}
+                    pending = []
+                    for est, attempt in tasks:
+                        task = asyncio.create_task(tag_attempt(est, attempt))
+                        est_of[task] = est
+                        pending.append(task)
                     batch_results_under_target = True  # Track if all results in this batch are under target
 
+                    def prune_dominated(should_cancel):
+                        for task in pending:
+                            if not task.done() and should_cancel(est_of[task]):
+                                task.cancel()
+
+                    # Attempts that lose the comparison are dead weight on
+                    # disk; with dozens of candidates per batch, dropping
+                    # each loser as soon as it's classified keeps peak temp
+                    # usage at roughly one GIF instead of one per attempt
+                    def discard_attempt(path):
+                        try:
+                            os.remove(path)
+                        except OSError:
+                            pass
+
                     try:
                         for coro in asyncio.as_completed(pending):
                             if self.cancellation_event.is_set():
@@ -2620,14 +3164,22 @@ class ModernGifConverter(ttk.Frame):
                                 break
 
                             try:
-                                size, temp_path, skip_dir = await coro
+                                est, (size, temp_path, skip_dir) = await coro
                                 if skip_dir and skip_dir != frames_dir:
                                     temp_files_to_cleanup.add(skip_dir)
 
                                 if size != float('inf') and temp_path and os.path.exists(temp_path):
                                     if size <= target_size_bytes:
+                                        # This fits; attempts estimated even
+                                        # smaller land farther from the target
+                                        # and can't beat it — stop paying for
+                                        # them (size is ~monotonic in the knobs)
+                                        prune_dominated(lambda e: e < est)
+
                                         if best_size == float('inf') or abs(target_size_bytes - size) < abs(
                                                 target_size_bytes - best_size):
+                                            if best_result and best_result != temp_path:
+                                                discard_attempt(best_result)
                                             best_size = size
                                             best_result = temp_path
                                             self.log(f"New best result: {best_size / 1024:.1f}KB")
@@ -2635,9 +3187,22 @@ class ModernGifConverter(ttk.Frame):
                                             # If we're very close to target size (within 5%), consider it good enough
                                             if abs(target_size_bytes - size) / target_size_bytes < 0.05:
                                                 found_acceptable_result = True
+                                                # The remaining attempts can only
+                                                # be discarded; stop paying for them
+                                                for task in pending:
+                                                    if not task.done():
+                                                        task.cancel()
                                                 break
+                                        else:
+                                            # Fits, but the incumbent is closer
+                                            discard_attempt(temp_path)
                                     else:
                                         batch_results_under_target = False  # At least one result was over target
+                                        # Attempts estimated even larger than
+                                        # this over-target result will bust
+                                        # the target too
+                                        prune_dominated(lambda e: e > est)
+                                        discard_attempt(temp_path)
                             except asyncio.CancelledError:
                                 continue
                     except asyncio.CancelledError:
@@ -2658,22 +3223,57 @@ class ModernGifConverter(ttk.Frame):
                 if best_result and os.path.exists(best_result) and not self.cancellation_event.is_set():
                     try:
                         self.log("\nFinalizing...")
+
+                        # The attempts optimized at -O2 for speed; give the
+                        # single winner gifsicle's full -O3 treatment now
+                        o3_output = f"{best_result}.o3.gif"
+                        o3_kwargs = {'stdout': subprocess.PIPE, 'stderr': subprocess.PIPE}
+                        if sys.platform == 'win32':
+                            o3_kwargs['startupinfo'] = _WIN_STARTUPINFO
+                            o3_kwargs['creationflags'] = _WIN_CREATIONFLAGS
+                        # Input is positional: -i means --interlace here,
+                        # which would bloat the file and change the format
+                        o3_proc = await asyncio.create_subprocess_exec(
+                            GIFSICLE_PATH, '-O3',
+                            *(['--careful'] if settings.get('careful_compat', False) else []),
+                            '--no-warnings',
+                            best_result, '-o', o3_output,
+                            **o3_kwargs
+                        )
+                        if await self._wait_for_process(o3_proc):
+                            try:
+                                o3_size = os.stat(o3_output).st_size
+                                if o3_size <= best_size:
+                                    best_result = o3_output
+                                    best_size = o3_size
+                            except OSError:
+                                pass
+
                         if os.path.exists(output_path):
                             os.remove(output_path)
 
                         # Check if ImageMagick optimization is enabled
-                        settings = OptionsWindow.load_settings()
                         use_imagemagick = settings.get('use_imagemagick', True)
 
                         if use_imagemagick:
                             self.log("Applying experimental optimization pass...")
                             final_path = await self.apply_imagemagick_optimization(best_result, output_path)
                         else:
-                            shutil.copy2(best_result, output_path)
+                            # Rename instead of copying the whole GIF; the
+                            # temp tree may sit on another filesystem
+                            # (tmpfs), where a move is still needed
+                            try:
+                                os.replace(best_result, output_path)
+                            except OSError:
+                                shutil.move(best_result, output_path)
                             final_path = output_path
 
-                        if os.path.exists(final_path):
-                            final_size = os.path.getsize(final_path)
+                        try:
+                            final_size = os.stat(final_path).st_size
+                        except OSError:
+                            final_size = None
+
+                        if final_size is not None:
                             if final_size <= target_size_bytes:
                                 size_diff_percentage = (target_size_bytes - final_size) / target_size_bytes * 100
                                 message = (f"GIF saved successfully!\n"
@@ -2709,26 +3309,24 @@ class ModernGifConverter(ttk.Frame):
                     messagebox.showerror("Error", str(e))
 
         finally:
-            # Clean up all temporary files
+            # Clean up all temporary files off the conversion path; the
+            # deletes themselves finish on the worker pool
             try:
                 self.log("Cleaning up temporary files...")
-                for temp_file in temp_files_to_cleanup:
-                    try:
-                        if os.path.exists(temp_file):
-                            if os.path.isdir(temp_file):
-                                shutil.rmtree(temp_file)
-                            else:
-                                os.remove(temp_file)
-                    except Exception as e:
-                        self.log(f"Error cleaning up {temp_file}: {e}")
-
-                # Clean up parent temporary directory
-                if temp_parent_dir and os.path.exists(temp_parent_dir):
-                    try:
-                        shutil.rmtree(temp_parent_dir)
-                    except Exception as e:
-                        self.log(f"Error during final cleanup: {str(e)}")
+                self._cleanup_temp_paths(temp_files_to_cleanup, temp_parent_dir)
+
+                # Every frames dir this conversion used (extraction,
+                # prescale, frame-skip) lives under the temp parent and is
+                # gone or on its way out; drop all their cached listings —
+                # frames_dir alone misses the rest and would leak one
+                # listing per conversion on unique mkdtemp parents
+                cache_prefix = os.path.join(temp_parent_dir, '')
+                for cached_dir in list(self._frames_cache):
+                    if cached_dir.startswith(cache_prefix):
+                        del self._frames_cache[cached_dir]
             finally:
+                if pulse_was_active:
+                    self.start_pulse_animation()
                 # Reset conversion state and button appearance
                 self.is_converting = False
                 self.convert_button.configure(
@@ -2802,6 +3400,15 @@ class ModernGifConverter(ttk.Frame):
         if not self.pulse_animation_active:
             return
 
+        # Nothing to draw while the indicator isn't mapped; poll slowly
+        # instead of burning a 60 fps wakeup on an invisible widget
+        try:
+            if not self.smart_panel_indicator.winfo_ismapped():
+                self.after(200, self.animate_pulse)
+                return
+        except tk.TclError:
+            return
+
         # Calculate new alpha value
         self.pulse_alpha += 10 if self.pulse_increasing else -10
         if self.pulse_alpha > 255:
@@ -2812,12 +3419,14 @@ class ModernGifConverter(ttk.Frame):
             self.pulse_increasing = True
 
         try:
-            # Convert alpha to hex and create a color with blue (#007bff) and variable alpha
-            alpha_hex = format(self.pulse_alpha, '02x')
-            color = f'#{alpha_hex}007bff'
-
-            # Try to directly set the background color
-            self.smart_panel_indicator.configure(background=color)
+            # Blue (#007bff) with variable alpha, from the precomputed table
+            color = _PULSE_COLORS[self.pulse_alpha]
+
+            # Crossing into Tk's configure machinery is the expensive part
+            # of this tick; skip it when the color hasn't moved
+            if color != self._last_pulse_color:
+                self.smart_panel_indicator.configure(background=color)
+                self._last_pulse_color = color
         except:
             # If that fails, fall back to the base style
             pass
@@ -2826,6 +3435,38 @@ class ModernGifConverter(ttk.Frame):
         self.after(16, self.animate_pulse)  # 16ms = 60fps
 
 
+@functools.lru_cache(maxsize=1)
+def _macos_bundle_bin_path() -> str:
+    """Resolve the bundled-binaries directory once per process."""
+    if getattr(sys, 'frozen', False):
+        # We're running in a PyInstaller bundle
+        return os.path.join(sys._MEIPASS, 'bin')
+    # We're running in a normal Python environment
+    return os.path.join(os.path.abspath(os.path.dirname(__file__)), 'bin')
+
+
+# Background thread running the macOS permission fixup, so the window can
+# paint while chmod/xattr work proceeds; joined before the first conversion
+_PERM_FIXUP_THREAD = None
+
+
+def start_macos_permission_fixup():
+    """Kick off the permission fixup without blocking first paint."""
+    global _PERM_FIXUP_THREAD
+    if sys.platform != 'darwin':
+        return
+    _PERM_FIXUP_THREAD = threading.Thread(
+        target=fix_macos_library_permissions, daemon=True
+    )
+    _PERM_FIXUP_THREAD.start()
+
+
+def wait_for_permission_fixup():
+    """Block until the background permission fixup (if any) has finished."""
+    if _PERM_FIXUP_THREAD is not None:
+        _PERM_FIXUP_THREAD.join()
+
+
 def fix_macos_library_permissions():
     """
     Fix permissions and security attributes for bundled binaries and libraries on macOS.
@@ -2837,72 +3478,113 @@ def fix_macos_library_permissions():
     print("Checking macOS binary permissions...")
 
     # Get the directory where our application and binaries are located
-    if getattr(sys, 'frozen', False):
-        # We're running in a PyInstaller bundle
-        base_path = os.path.join(sys._MEIPASS, 'bin')
-    else:
-        # We're running in a normal Python environment
-        base_path = os.path.join(os.path.abspath(os.path.dirname(__file__)), 'bin')
+    base_path = _macos_bundle_bin_path()
 
     if not os.path.exists(base_path):
         print(f"Warning: Binary path {base_path} not found")
         return
 
+    # The chmod/xattr results persist on disk, so a sentinel newer than
+    # the bin directory means a previous launch already did the work.
+    # Onefile builds re-extract to a fresh directory and naturally take
+    # the cold path
+    sentinel = os.path.join(base_path, '.giflight_perms_v1')
+    try:
+        if os.path.getmtime(sentinel) >= os.path.getmtime(base_path):
+            return
+    except OSError:
+        pass
+
     # List of binaries to check
     binaries = ['ffmpeg', 'gifski', 'gifsicle', 'magick', 'convert']
 
-    # Find and fix each binary
+    # Collect every path to fix first, then do the work in bulk: the
+    # per-file version spawned two xattr processes per binary, which
+    # dominated startup once the bundle carried dozens of dylibs
+    # One directory read answers which binary variants are present,
+    # instead of an exists() stat per name/suffix combination
+    try:
+        with os.scandir(base_path) as entries:
+            present = {entry.name for entry in entries}
+    except OSError:
+        present = set()
+
+    fix_paths = []
     for binary in binaries:
-        # Check main binary
-        binary_path = os.path.join(base_path, binary)
-        if os.path.exists(binary_path):
-            _fix_binary_permissions(binary_path)
-
-        # Check arm64 variant
-        arm64_path = os.path.join(base_path, f"{binary}_arm64")
-        if os.path.exists(arm64_path):
-            _fix_binary_permissions(arm64_path)
-
-        # Check universal variant
-        universal_path = os.path.join(base_path, f"{binary}_universal")
-        if os.path.exists(universal_path):
-            _fix_binary_permissions(universal_path)
-
-    # Check for lib directory and fix permissions for all dynamic libraries
+        for suffix in ('', '_arm64', '_universal'):
+            name = binary + suffix
+            if name in present:
+                fix_paths.append(os.path.join(base_path, name))
+
+    # Check for lib directory and collect all dynamic libraries. Recurse
+    # with scandir rather than os.walk: the DirEntry objects carry the file
+    # type from the directory read itself, so classifying hundreds of
+    # bundled dylibs costs no extra stat per entry
     lib_path = os.path.join(base_path, 'lib')
-    if os.path.exists(lib_path) and os.path.isdir(lib_path):
+    if os.path.isdir(lib_path):
         print(f"Fixing permissions for libraries in {lib_path}")
-        for root, dirs, files in os.walk(lib_path):
-            for file in files:
-                if file.endswith('.dylib') or file.endswith('.so'):
-                    library_path = os.path.join(root, file)
-                    _fix_binary_permissions(library_path)
+        stack = [lib_path]
+        while stack:
+            try:
+                with os.scandir(stack.pop()) as entries:
+                    for entry in entries:
+                        if entry.is_dir(follow_symlinks=False):
+                            stack.append(entry.path)
+                        elif entry.name.endswith(('.dylib', '.so')):
+                            fix_paths.append(entry.path)
+            except OSError as e:
+                print(f"Could not scan library directory: {e}")
     else:
         print("No lib directory found")
 
+    if not fix_paths:
+        return
 
-def _fix_binary_permissions(file_path):
-    """Fix permissions and remove quarantine for a single binary or library"""
+    # Strip the quarantine attribute without any subprocess. CPython only
+    # exposes the xattr syscalls on Linux, but on Darwin libSystem's
+    # removexattr(2) is one ctypes call away — a microsecond syscall per
+    # file instead of a fork/exec. Files without the attribute fail with
+    # ENOATTR, which is the desired end state either way
     try:
-        # Make sure the file is executable
-        os.chmod(file_path, 0o755)
-        print(f"Set executable permissions for {os.path.basename(file_path)}")
+        import ctypes
+        libc = ctypes.CDLL(None, use_errno=True)
+    except Exception:
+        libc = None
+
+    def fix_one(file_path):
+        try:
+            os.chmod(file_path, 0o755)
+        except OSError as e:
+            return f"Error fixing permissions for {file_path}: {e}"
+        if libc is not None:
+            libc.removexattr(os.fsencode(file_path), b'com.apple.quarantine', 0)
+        return None
 
-        # Remove quarantine attribute if present (requires xattr)
+    # Both syscalls release the GIL, and on a cold first launch each one
+    # touches an uncached inode, so spreading the files over a small pool
+    # overlaps the disk waits. Messages are printed here, not in the
+    # workers, to keep stdout from interleaving
+    with concurrent.futures.ThreadPoolExecutor(max_workers=8) as pool:
+        for error in pool.map(fix_one, fix_paths):
+            if error:
+                print(error)
+
+    if libc is None:
+        # Fall back to one batched xattr invocation covering all paths
         try:
-            # Check if file has quarantine attribute
-            result = subprocess.run(['xattr', '-l', file_path],
-                                    capture_output=True, text=True)
-
-            if 'com.apple.quarantine' in result.stdout:
-                print(f"Removing quarantine attribute from {os.path.basename(file_path)}")
-                subprocess.run(['xattr', '-d', 'com.apple.quarantine', file_path],
-                               capture_output=True)
+            subprocess.run(['xattr', '-d', 'com.apple.quarantine', *fix_paths],
+                           capture_output=True)
         except Exception as e:
-            print(f"Could not check/remove quarantine attribute: {e}")
+            print(f"Could not remove quarantine attributes: {e}")
 
-    except Exception as e:
-        print(f"Error fixing permissions for {file_path}: {e}")
+    # Mark the pass complete so warm launches return after a single stat
+    try:
+        with open(sentinel, 'w'):
+            pass
+    except OSError:
+        pass
+
+    print(f"Fixed permissions for {len(fix_paths)} bundled files")
 
 
 def main():
@@ -2912,7 +3594,9 @@ def main():
         if sys.platform == 'darwin':
             # macOS specific settings
             os.environ['TK_SILENCE_DEPRECATION'] = '1'  # Silence deprecation warnings on macOS
-            fix_macos_library_permissions()
+            # Fix bundle permissions concurrently with window construction;
+            # check_dependencies joins the thread before anything is spawned
+            start_macos_permission_fixup()
             # Attempt to enable high DPI support for Retina displays
             try:
                 from tkinter import _tkinter
@@ -2964,6 +3648,14 @@ def main():
     # Initialize the main application
     app = ModernGifConverter(root)
 
+    # Stop the shared background asyncio loop when the window closes
+    def on_close():
+        app._signal_cancel()
+        app._async_loop.call_soon_threadsafe(app._async_loop.stop)
+        root.destroy()
+
+    root.protocol("WM_DELETE_WINDOW", on_close)
+
     # Start the main event loop
     root.mainloop()
 
@@ -4,6 +4,33 @@ from tkinter import ttk
 import json
 import os
 
+# Options-dialog ttk styles, applied in one pass by
+# OptionsWindow.setup_styles — same single-table layout as the main
+# window's _STYLES, so theme tweaks stay one edit per window
+_STYLES = {
+    'Options.TFrame': {'background': '#1a1a1a', 'padding': 20},
+    'Options.TCheckbutton': {'background': '#1a1a1a', 'foreground': 'white',
+                             'font': ('Segoe UI', 10)},
+    'Options.TLabel': {'background': '#1a1a1a', 'foreground': 'white',
+                       'font': ('Segoe UI', 10)},
+    'Options.TEntry': {'fieldbackground': '#2d2d2d', 'foreground': 'white'},
+    'Options.TButton': {'font': ('Segoe UI', 10)},
+}
+
+# Checkbox options, in display order: settings key, checkbox text, tooltip
+_OPTIONS = (
+    ('lock_quality', 'Lock Quality at Maximum',
+     'Disables quality compression entirely'),
+    ('lock_lossy', 'Disable Diffusion',
+     'Disables grain diffusion'),
+    ('lock_frame_skip', 'Do not lower frame rate',
+     'Maintains original frame rate'),
+    ('preserve_animated_alpha', 'Preserve animated transparency',
+     'Keeps per-frame transparency but may increase file size'),
+    ('use_imagemagick', 'Use experimental compression',
+     'New lossy compressions method, may further reduce file size up to 50%'),
+)
+
 
 class OptionsWindow(tk.Toplevel):
     def __init__(self, master):
@@ -28,7 +55,11 @@ class OptionsWindow(tk.Toplevel):
 
         # Initialize scale variable with default
         self.scale_value = tk.StringVar(value=str(self.settings.get('scale', 100)))
-        self.use_imagemagick = tk.BooleanVar(value=self.settings.get('use_imagemagick', False))
+
+        # Register the shared entry validators once; both input groups
+        # reuse these instead of building fresh closures per widget
+        self._vcmd_loop = (self.register(self._validate_loop_count), '%P')
+        self._vcmd_scale = (self.register(self._validate_scale), '%P')
 
         self.create_widgets()
 
@@ -37,26 +68,8 @@ class OptionsWindow(tk.Toplevel):
 
     def setup_styles(self):
         """Configure custom styles for the options window"""
-        self.style.configure('Options.TFrame',
-                             background='#1a1a1a',
-                             padding=20)
-
-        self.style.configure('Options.TCheckbutton',
-                             background='#1a1a1a',
-                             foreground='white',
-                             font=('Segoe UI', 10))
-
-        self.style.configure('Options.TLabel',  # Add label style
-                             background='#1a1a1a',
-                             foreground='white',
-                             font=('Segoe UI', 10))
-
-        self.style.configure('Options.TEntry',  # Add entry style
-                             fieldbackground='#2d2d2d',
-                             foreground='white')
-
-        self.style.configure('Options.TButton',
-                             font=('Segoe UI', 10))
+        for name, opts in _STYLES.items():
+            self.style.configure(name, **opts)
 
     def create_widgets(self):
         """Create and arrange all widgets in the options window"""
@@ -64,37 +77,11 @@ class OptionsWindow(tk.Toplevel):
         main_frame = ttk.Frame(self, style='Options.TFrame')
         main_frame.pack(fill=tk.BOTH, expand=True)
 
-        # Variables for checkboxes
-        self.lock_quality = tk.BooleanVar(value=self.settings.get('lock_quality', False))
-        self.lock_lossy = tk.BooleanVar(value=self.settings.get('lock_lossy', False))
-        self.lock_frame_skip = tk.BooleanVar(value=self.settings.get('lock_frame_skip', False))
-        self.preserve_animated_alpha = tk.BooleanVar(value=self.settings.get('preserve_animated_alpha', False))
-
-        # Option groups with tooltips
-        self.add_option_group(main_frame,
-                            "Lock Quality at Maximum",
-                            "Disables quality compression entirely",
-                            self.lock_quality)
-
-        self.add_option_group(main_frame,
-                            "Disable Diffusion",
-                            "Disables grain diffusion",
-                            self.lock_lossy)
-
-        self.add_option_group(main_frame,
-                            "Do not lower frame rate",
-                            "Maintains original frame rate",
-                            self.lock_frame_skip)
-
-        self.add_option_group(main_frame,
-                            "Preserve animated transparency",
-                            "Keeps per-frame transparency but may increase file size",
-                            self.preserve_animated_alpha)
-
-        self.add_option_group(main_frame,
-                              "Use experimental compression",
-                              "New lossy compressions method, may further reduce file size up to 50%",
-                              self.use_imagemagick)
+        # Checkbox option groups with tooltips, built from the _OPTIONS table
+        for setting_key, checkbox_text, tooltip_text in _OPTIONS:
+            variable = tk.BooleanVar(value=self.settings.get(setting_key, False))
+            setattr(self, setting_key, variable)
+            self.add_option_group(main_frame, checkbox_text, tooltip_text, variable)
 
         self.add_loop_count_group(main_frame)
 
@@ -148,8 +135,6 @@ class OptionsWindow(tk.Toplevel):
                            anchor='w',
                            justify='left')
 
-        # Force the color update after creation
-        tooltip.configure(foreground='#555555')
         tooltip.pack(fill=tk.X)
 
     def center_window(self):
@@ -173,23 +158,11 @@ class OptionsWindow(tk.Toplevel):
                              style='Options.TLabel')
         loop_label.pack(anchor='w')
 
-        def validate_loop_count(value):
-            if value == "":  # Allow empty string for backspace
-                return True
-            try:
-                if len(value) > 3:  # Don't allow more than 3 digits
-                    return False
-                num = int(value)
-                return num >= 0  # Only allow non-negative numbers
-            except ValueError:
-                return False
-
         # Input field with validation
-        vcmd = (self.register(validate_loop_count), '%P')
         loop_entry = ttk.Entry(loop_frame,
                              textvariable=self.loop_count,
                              validate='key',
-                             validatecommand=vcmd,
+                             validatecommand=self._vcmd_loop,
                              width=10,
                              style='Options.TEntry')
         loop_entry.pack(anchor='w', padx=20)
@@ -219,24 +192,11 @@ class OptionsWindow(tk.Toplevel):
                                 style='Options.TLabel')
         scale_label.pack(anchor='w')
 
-        # Create a more permissive validation
-        def validate_scale(value):
-            if value == "":  # Allow empty string for backspace
-                return True
-            try:
-                if len(value) > 3:  # Don't allow more than 3 digits
-                    return False
-                num = int(value)
-                return 0 <= num <= 100  # More permissive range check
-            except ValueError:
-                return False
-
         # Input field with validation
-        vcmd = (self.register(validate_scale), '%P')
         scale_entry = ttk.Entry(scale_frame,
                                 textvariable=self.scale_value,
                                 validate='key',
-                                validatecommand=vcmd,
+                                validatecommand=self._vcmd_scale,
                                 width=10,
                                 style='Options.TEntry')
         scale_entry.pack(anchor='w', padx=20)
@@ -253,6 +213,18 @@ class OptionsWindow(tk.Toplevel):
                            justify='left')
         tooltip.pack(fill=tk.X)
 
+    @staticmethod
+    def _validate_loop_count(value):
+        """Key validator: up to three digits (empty allowed for backspace)"""
+        return value == "" or (value.isdigit() and len(value) <= 3)
+
+    @staticmethod
+    def _validate_scale(value):
+        """Key validator: 0-100 (empty allowed for backspace)"""
+        if value == "":
+            return True
+        return value.isdigit() and len(value) <= 3 and int(value) <= 100
+
     def save_and_close(self):
         """Save the current settings and close the window"""
         try:
@@ -292,14 +264,27 @@ class OptionsWindow(tk.Toplevel):
 
         return os.path.join(base_path, 'giflight_settings.json')
 
+    # Parsed settings, cached by file mtime/size: conversions consult the
+    # settings once per optimization attempt, and the JSON only changes
+    # when the user hits Save
+    _settings_cache: dict = {}
+    _settings_cache_key = None
+
     @classmethod
     def load_settings(cls):
-        """Load settings from file"""
+        """Load settings from file (cached until the file changes)"""
         try:
             settings_path = cls.get_settings_path()
-            if os.path.exists(settings_path):
+            try:
+                stat = os.stat(settings_path)
+            except OSError:
+                return {}
+            cache_key = (stat.st_mtime_ns, stat.st_size)
+            if cache_key != cls._settings_cache_key:
                 with open(settings_path, 'r') as f:
-                    return json.load(f)
+                    cls._settings_cache = json.load(f)
+                cls._settings_cache_key = cache_key
+            return cls._settings_cache
         except Exception as e:
             print(f"Error loading settings: {e}")
         return {}
@@ -308,8 +293,21 @@ class OptionsWindow(tk.Toplevel):
     def save_settings(cls, settings):
         """Save settings to file"""
         try:
+            # Closing the dialog without touching anything is the common
+            # case; don't rewrite (and re-mtime) an unchanged file
+            if cls._settings_cache_key is not None and settings == cls._settings_cache:
+                return
+
+            # Write to a sibling temp file and rename it into place so a
+            # crash mid-save can't leave a truncated settings file behind
             settings_path = cls.get_settings_path()
-            with open(settings_path, 'w') as f:
+            tmp_path = settings_path + '.tmp'
+            with open(tmp_path, 'w') as f:
                 json.dump(settings, f)
+            os.replace(tmp_path, settings_path)
+
+            stat = os.stat(settings_path)
+            cls._settings_cache = settings
+            cls._settings_cache_key = (stat.st_mtime_ns, stat.st_size)
         except Exception as e:
             print(f"Error saving settings: {e}")
\ No newline at end of file